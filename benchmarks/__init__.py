@@ -0,0 +1,34 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Performance benchmarks for django-environ-2.
+
+Every module can be run on its own, e.g.::
+
+    python -m benchmarks.bench_scheme
+
+``benchmarks.suite`` covers every accessor and parser and saves its
+results as JSON, to compare releases with each other.
+"""
+
+import timeit
+
+
+def measure(func, number=1000, repeat=5):
+    """Return the best time per call of ``func`` in seconds."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(title, results):
+    """Print ``(label, seconds)`` pairs relative to the first one."""
+    print(title)
+    baseline = results[0][1]
+    for label, seconds in results:
+        print('  {:<40} {:>12.3f} us {:>8.2f}x'.format(
+            label, seconds * 1e6, baseline / seconds))
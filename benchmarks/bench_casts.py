@@ -0,0 +1,103 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Compare the cast registry of Env.parse_value with the former if/elif chain.
+"""
+
+import json
+import re
+
+from environ import Env
+from environ.environ import _urlparse
+from . import measure, report
+
+# (label, raw value, cast) of every cast built into Env
+CASTS = (
+    ('str', 'hello', str),
+    ('int', '42', int),
+    ('bool', 'true', bool),
+    ('bool', '0', bool),
+    ('bool', 'off', bool),
+    ('float', '33.3', float),
+    ('float', '1.234,5', float),
+    ('json', '{"one": "bar"}', json.loads),
+    ('url', 'https://example.com/path', _urlparse),
+    ('list', 'a,b,c', list),
+    ('tuple', '(a,b,c)', tuple),
+    ('dict', 'a=1,b=2', dict),
+    ('[int]', '1,2,3', [int]),
+    ('(int,)', '(1,2,3)', (int,)),
+    ('{value: int}', 'a=1;b=2', {'value': int}),
+)
+
+
+def legacy_parse_value(value, cast):
+    """Env.parse_value as implemented with an if/elif chain."""
+    if cast is None:
+        return value
+
+    if cast is bool:
+        try:
+            value = int(value) != 0
+        except ValueError:
+            value = value.lower() in Env.BOOLEAN_TRUE_STRINGS
+    elif isinstance(cast, list):
+        value = list(map(cast[0], [x for x in value.split(',') if x]))
+    elif isinstance(cast, tuple):
+        val = value.strip('(').strip(')').split(',')
+        value = tuple(map(cast[0], [x for x in val if x]))
+    elif isinstance(cast, dict):
+        key_cast = cast.get('key', str)
+        value_cast = cast.get('value', str)
+        value_cast_by_key = cast.get('cast', {})
+        value = dict(map(
+            lambda kv: (
+                key_cast(kv[0]),
+                legacy_parse_value(
+                    kv[1],
+                    value_cast_by_key.get(kv[0], value_cast)
+                )
+            ),
+            [val.split('=') for val in value.split(';') if val]
+        ))
+    elif cast is dict:
+        value = dict([val.split('=') for val in value.split(',') if val])
+    elif cast is list:
+        value = [x for x in value.split(',') if x]
+    elif cast is tuple:
+        val = value.strip('(').strip(')').split(',')
+        value = tuple([x for x in val if x])
+    elif cast is float:
+        float_str = re.sub(r'[^\d,.-]', '', value)
+        parts = re.split(r'[,.]', float_str)
+        if len(parts) == 1:
+            float_str = parts[0]
+        else:
+            float_str = "{}.{}".format(''.join(parts[0:-1]), parts[-1])
+        value = float(float_str)
+    else:
+        value = cast(value)
+    return value
+
+
+def main():
+    for label, value, cast in CASTS:
+        expected = legacy_parse_value(value, cast)
+        assert Env.parse_value(value, cast) == expected, label
+
+    for label, value, cast in CASTS:
+        report('Cast {!r} as {}'.format(value, label), [
+            ('if/elif chain',
+             measure(lambda: legacy_parse_value(value, cast), 20000, 9)),
+            ('Env.parse_value()',
+             measure(lambda: Env.parse_value(value, cast), 20000, 9)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
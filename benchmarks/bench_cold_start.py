@@ -0,0 +1,233 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Measure the cold start of a generated Django style settings module.
+
+The harness writes a large ``.env`` file and a ``settings.py`` reading it
+with ``read_env``, casting hundreds of variables and parsing database,
+cache, email and search URLs.  Every run imports the settings in a fresh
+interpreter and reports, per subsystem:
+
+* ``compat``: importing environ and resolving the compat names,
+* ``read_env``: reading the ``.env`` file,
+* ``casting``: the typed ``Env`` lookups,
+* ``url_parsing``: the ``*_url`` lookups,
+
+the best wall time of all runs and the peak memory allocated according to
+``tracemalloc``, followed by the ``-X importtime`` breakdown of environ.
+Pass ``--json FILE`` to save the results::
+
+    python -m benchmarks.bench_cold_start --variables 500 --lines 100000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from .bench_import import parse_importtime
+from .bench_read_env import generate_lines
+
+RUNS = 5
+PHASES = ('compat', 'read_env', 'casting', 'url_parsing')
+
+# Variables of the generated settings: (name, value, accessor)
+TYPED_VARIABLES = (
+    ('DEBUG_{}', 'on', 'bool'),
+    ('WORKERS_{}', '{}', 'int'),
+    ('RATIO_{}', '0.{}', 'float'),
+    ('NAME_{}', 'service-{}', 'str'),
+    ('HOSTS_{}', 'a{}.example.com,b{}.example.com', 'list'),
+    ('LIMITS_{}', 'read={},write={}', 'dict'),
+    ('PAYLOAD_{}', '{{"id": {}}}', 'json'),
+)
+
+URL_VARIABLES = (
+    ('DATABASE_URL_{}', 'postgres://user:secret@db{}.example.com:5432/app'
+                        '?conn_max_age=600', 'db'),
+    ('CACHE_URL_{}', 'rediscache://cache{}.example.com:6379/1'
+                     '?timeout=300&key_prefix=app', 'cache'),
+    ('EMAIL_URL_{}', 'smtps://user@example.com:secret@smtp{}.example.com:587',
+     'email_url'),
+    ('SEARCH_URL_{}', 'elasticsearch7://search{}.example.com:9200/index',
+     'search_url'),
+)
+
+SETTINGS_HEAD = '''\
+import json
+import os
+import time
+import tracemalloc
+
+_TRACE = bool(os.environ.get('BENCH_TRACE'))
+_RESULTS = {}
+
+
+class _Phase:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if _TRACE:
+            tracemalloc.start()
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        result = {'seconds': time.perf_counter() - self.start}
+        if _TRACE:
+            result['peak'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        _RESULTS[self.name] = result
+
+
+with _Phase('compat'):
+    import environ
+    environ.compat.ImproperlyConfigured
+    environ.Env.DB_SCHEMES['postgres']
+    environ.Env.CACHE_SCHEMES['redis']
+
+env = environ.Env()
+
+with _Phase('read_env'):
+    environ.Env.read_env(os.path.join(os.path.dirname(__file__), '.env'))
+'''
+
+SETTINGS_TAIL = '''
+print(json.dumps(_RESULTS))
+'''
+
+
+def write_project(directory, variables, lines):
+    """Write ``.env`` and ``settings.py`` into `directory`."""
+    with open(os.path.join(directory, '.env'), 'w') as file:
+        for i in range(variables):
+            name, value, _ = TYPED_VARIABLES[i % len(TYPED_VARIABLES)]
+            file.write('{}={}\n'.format(
+                name.format(i), value.format(i, i)))
+        for i in range(max(1, variables // 50)):
+            for name, value, _ in URL_VARIABLES:
+                file.write('{}={}\n'.format(
+                    name.format(i), value.format(i)))
+        file.writelines(generate_lines(lines))
+
+    with open(os.path.join(directory, 'settings.py'), 'w') as file:
+        file.write(SETTINGS_HEAD)
+        file.write('\nwith _Phase(\'casting\'):\n')
+        for i in range(variables):
+            name, _, accessor = TYPED_VARIABLES[i % len(TYPED_VARIABLES)]
+            file.write('    {0} = env.{1}({0!r})\n'.format(
+                name.format(i), accessor))
+        file.write('\nwith _Phase(\'url_parsing\'):\n')
+        for i in range(max(1, variables // 50)):
+            for name, _, accessor in URL_VARIABLES:
+                file.write('    {0} = env.{1}({0!r})\n'.format(
+                    name.format(i), accessor))
+        file.write(SETTINGS_TAIL)
+
+
+def import_settings(directory, trace=False, importtime=False):
+    """Import the settings in a fresh interpreter.
+
+    :returns: A tuple of the phase results, the wall time of the whole
+        interpreter in seconds and the ``-X importtime`` modules.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environ = dict(os.environ)
+    environ['PYTHONPATH'] = os.pathsep.join([directory, root])
+    if trace:
+        environ['BENCH_TRACE'] = '1'
+
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += [
+        '-c',
+        'import time; start = time.perf_counter(); import settings; '
+        'print(time.perf_counter() - start)',
+    ]
+    result = subprocess.run(
+        command,
+        cwd=directory,
+        env=environ,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    phases, wall = result.stdout.splitlines()
+    return json.loads(phases), float(wall), parse_importtime(result.stderr)
+
+
+def run(variables, lines, runs=RUNS):
+    """Run the harness and return its results as a JSON serializable dict."""
+    with tempfile.TemporaryDirectory() as directory:
+        write_project(directory, variables, lines)
+        timings = [import_settings(directory) for _ in range(runs)]
+        traced, _, _ = import_settings(directory, trace=True)
+        _, _, modules = import_settings(directory, importtime=True)
+
+    return {
+        'variables': variables,
+        'lines': lines,
+        'wall': min(wall for _, wall, _ in timings),
+        'phases': {
+            phase: {
+                'seconds': min(run[0][phase]['seconds'] for run in timings),
+                'peak': traced[phase]['peak'],
+            }
+            for phase in PHASES
+        },
+        'importtime': {
+            name: {'self': self_us, 'cumulative': cumulative_us}
+            for name, (self_us, cumulative_us) in modules.items()
+            if name.split('.')[0] in ('environ', 'django', 'settings')
+        },
+    }
+
+
+def report(results):
+    print('Import settings with {variables} variables and {lines} more '
+          '.env lines'.format(**results))
+    print('  {:<20} {:>12.1f} ms'.format('wall time', results['wall'] * 1e3))
+    for phase, result in results['phases'].items():
+        print('  {:<20} {:>12.1f} ms {:>12.1f} KiB peak'.format(
+            phase, result['seconds'] * 1e3, result['peak'] / 1024))
+    print('  -X importtime')
+    for name, result in results['importtime'].items():
+        print('    {:<32} self {:>8} us, cumulative {:>8} us'.format(
+            name, result['self'], result['cumulative']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.bench_cold_start',
+        description='Measure the cold start of a generated settings module.')
+    parser.add_argument('--variables', type=int, default=500,
+                        help='typed variables read by the settings '
+                             '(default: 500)')
+    parser.add_argument('--lines', type=int, default=10000,
+                        help='additional .env lines (default: 10000)')
+    parser.add_argument('--runs', type=int, default=RUNS,
+                        help='timed runs (default: {})'.format(RUNS))
+    parser.add_argument('--json', metavar='FILE',
+                        help='write the results to FILE')
+    args = parser.parse_args(argv)
+
+    results = run(args.variables, args.lines, args.runs)
+    report(results)
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+            file.write(os.linesep)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,64 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Compare compiled dict casts and lazy mappings with the former per call
+parsing on large ``key=value;...`` values.
+"""
+
+import sys
+
+from environ import Env, LazyMapping
+from . import measure, report
+from .bench_casts import legacy_parse_value
+
+SIZES = (100, 10000)
+
+SPECS = (
+    ('{value: int}', {'value': int}),
+    ('{key: str, value: float}', {'key': str, 'value': float}),
+    ('{value: bool, cast: {...}}', {
+        'value': bool,
+        'cast': {'route_0': str, 'route_1': int, 'route_2': [int]},
+    }),
+)
+
+
+def make_value(size):
+    return ';'.join('route_{}={}'.format(i, i % 7) for i in range(size))
+
+
+def lazy_lookups(value, spec, keys=('route_0', 'route_1', 'route_2')):
+    """Build a LazyMapping and look up a few keys, as a worker would."""
+    routes = LazyMapping(value, spec)
+    return [routes[key] for key in keys]
+
+
+def main(sizes=SIZES):
+    for size in sizes:
+        value = make_value(size)
+        for label, spec in SPECS:
+            plan = Env(ROUTES=spec)._plans['ROUTES']
+            expected = legacy_parse_value(value, spec)
+            assert Env.parse_value(value, spec) == expected
+            assert plan.caster(value) == expected
+
+            number = max(1, 10000 // size)
+            report('Cast {} entries as {}'.format(size, label), [
+                ('parse_value() before',
+                 measure(lambda: legacy_parse_value(value, spec), number)),
+                ('Env.parse_value()',
+                 measure(lambda: Env.parse_value(value, spec), number)),
+                ('compiled scheme plan',
+                 measure(lambda: plan.caster(value), number)),
+                ('LazyMapping, 3 lookups',
+                 measure(lambda: lazy_lookups(value, spec), number)),
+            ])
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
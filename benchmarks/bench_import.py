@@ -0,0 +1,93 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Measure what ``import environ`` costs using ``-X importtime``.
+
+The "eager" scenario additionally does what ``environ.compat`` did on
+import before its names were resolved lazily: looking the ``django`` and
+``redis_cache`` loaders up and importing Django's exceptions.  For an exact
+comparison, pass checkouts of other revisions, e.g. made with
+``git worktree add /tmp/base <rev>``, to time their ``import environ``::
+
+    python -m benchmarks.bench_import /tmp/base
+"""
+
+import os
+import subprocess
+import sys
+
+RUNS = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = (
+    ('lazy', 'import environ'),
+    ('eager', 'import pkgutil; '
+              "pkgutil.find_loader('django') and "
+              "__import__('django.core.exceptions'); "
+              "pkgutil.find_loader('redis_cache'); "
+              'import environ'),
+)
+
+
+def importtime(code, root=ROOT):
+    """Run ``code`` in a fresh interpreter in `root` and return its import
+    times.
+
+    :returns: A tuple of the wall time of ``code`` in seconds and a dict
+        mapping module names to their (self, cumulative) import time in
+        microseconds.
+    """
+    script = ('import time; start = time.perf_counter(); {}; '
+              'print(time.perf_counter() - start)').format(code)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    return float(result.stdout), parse_importtime(result.stderr)
+
+
+def parse_importtime(output):
+    """Parse ``-X importtime`` output.
+
+    :returns: A dict mapping module names to their (self, cumulative)
+        import time in microseconds.
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main(roots=()):
+    scenarios = [(label, code, ROOT) for label, code in SCENARIOS]
+    scenarios.extend(
+        (os.path.abspath(root), 'import environ', root) for root in roots)
+
+    for label, code, root in scenarios:
+        runs = [importtime(code, root) for _ in range(RUNS)]
+        wall, modules = min(runs, key=lambda run: run[0])
+        print('{} ({}):'.format(label, code))
+        print('  wall time {:>10.1f} us'.format(wall * 1e6))
+        for name in ('environ', 'environ.environ', 'environ.compat',
+                     'django', 'django.core.exceptions'):
+            if name in modules:
+                print('  {:<24} self {:>8} us, cumulative {:>8} us'.format(
+                    name, *modules[name]))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
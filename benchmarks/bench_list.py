@@ -0,0 +1,59 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Compare Env.list with Env.iter_list and Env.array on long lists of IDs."""
+
+import sys
+import tracemalloc
+
+from environ import Env
+from . import measure, report
+
+SIZES = (1000, 50000)
+
+
+def memory(func):
+    """Return the peak and the retained memory of ``func`` in bytes."""
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841, keep the result alive
+        current, peak = tracemalloc.get_traced_memory()
+        return peak, current
+    finally:
+        tracemalloc.stop()
+
+
+def main(sizes=SIZES):
+    for size in sizes:
+        env = Env()
+        env.ENVIRON = {
+            'IDS': ','.join(str(1000000 + i) for i in range(size)),
+        }
+
+        assert list(env.iter_list('IDS', cast=int)) == env.list('IDS', int)
+        assert env.array('IDS', 'q').tolist() == env.list('IDS', int)
+
+        funcs = [
+            ('Env.list(cast=int)', lambda: env.list('IDS', cast=int)),
+            ('sum(Env.iter_list(cast=int))',
+             lambda: sum(env.iter_list('IDS', cast=int))),
+            ("Env.array('q')", lambda: env.array('IDS', 'q')),
+        ]
+        number = max(1, 100000 // size)
+        report('Parse {} IDs'.format(size), [
+            (label, measure(func, number)) for label, func in funcs
+        ])
+        print('  {:<40} {:>15} {:>12}'.format('', 'peak', 'retained'))
+        for label, func in funcs:
+            peak, retained = memory(func)
+            print('  {:<40} {:>12.1f} kB {:>9.1f} kB'.format(
+                label, peak / 1024, retained / 1024))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
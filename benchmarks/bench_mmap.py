@@ -0,0 +1,45 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Compare memory mapped read_env with reading the whole file."""
+
+import sys
+import tempfile
+
+from environ import Env
+from . import measure, report
+from .bench_read_env import DiscardingEnviron, peak_memory, write_env_file
+
+SIZES = (1000, 100000, 1000000)
+
+
+def main(sizes=SIZES):
+    with tempfile.TemporaryDirectory() as directory:
+        for count in sizes:
+            path = write_env_file(directory, count)
+
+            def read_env(memory_map, file_path=path):
+                Env.ENVIRON = DiscardingEnviron()
+                Env.read_env(file_path, encoding='utf-8',
+                             memory_map=memory_map)
+
+            number = max(1, 100000 // count)
+            repeat = 3 if count < 1000000 else 1
+            report('Read {} lines'.format(count), [
+                ('open().read()',
+                 measure(lambda: read_env(False), number, repeat)),
+                ('mmap', measure(lambda: read_env(True), number, repeat)),
+            ])
+            print('  peak memory: open().read() {:.1f} KiB, '
+                  'mmap {:.1f} KiB'.format(
+                      peak_memory(lambda: read_env(False)) / 1024,
+                      peak_memory(lambda: read_env(True)) / 1024))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
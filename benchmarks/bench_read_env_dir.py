@@ -0,0 +1,45 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Compare read_env_dir with calling read_env for every file."""
+
+import os
+import tempfile
+
+from environ import Env
+from . import measure, report
+from .bench_read_env import generate_lines
+
+FILES = 8
+LINES = 20000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(FILES):
+            path = os.path.join(directory, '{:02d}-layer.env'.format(i * 10))
+            with open(path, 'w') as file:
+                file.writelines(generate_lines(LINES))
+
+        def read_env():
+            Env.ENVIRON = {}
+            for name in sorted(os.listdir(directory)):
+                Env.read_env(os.path.join(directory, name))
+
+        def read_env_dir():
+            Env.ENVIRON = {}
+            Env.read_env_dir(directory)
+
+        report('Read {} files of {} lines'.format(FILES, LINES), [
+            ('read_env() per file', measure(read_env, 3, 3)),
+            ('read_env_dir()', measure(read_env_dir, 3, 3)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
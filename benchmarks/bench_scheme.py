@@ -0,0 +1,108 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Compare scheme lookups through compiled plans with the legacy path."""
+
+from environ import Env, logger, NoValue
+from . import measure, report
+
+VARIABLES = 400
+
+CASTS = [
+    (int, '42'),
+    (bool, 'true'),
+    (str, 'value'),
+    ((float, 0.5), '33.3'),
+    (([int], []), '1,2,3'),
+]
+
+
+def legacy_get_value(env, var, cast=None, default=Env.NOTSET,
+                     parse_default=False):
+    """Env.get_value as implemented before scheme plans were compiled."""
+    logger.debug("get '%s' casted as '%s' with default '%s'",
+                 var, cast, default)
+
+    if var in env.scheme:
+        var_info = env.scheme[var]
+
+        try:
+            has_default = len(var_info) == 2
+        except TypeError:
+            has_default = False
+
+        if has_default:
+            if not cast:
+                cast = var_info[0]
+
+            if default is env.NOTSET:
+                try:
+                    default = var_info[1]
+                except IndexError:
+                    pass
+        else:
+            if not cast:
+                cast = var_info
+
+    try:
+        value = env.ENVIRON[var]
+    except KeyError:
+        value = default
+
+    if env.interpolate and hasattr(value, 'startswith') and \
+            value.startswith('$'):
+        value = value.lstrip('$')
+        value = legacy_get_value(env, value, cast=cast, default=default)
+
+    if env.smart_cast:
+        if cast is None and default is not None and \
+                not isinstance(default, NoValue):
+            cast = type(default)
+
+    if value != default or (parse_default and value):
+        value = env.parse_value(value, cast)
+
+    return value
+
+
+def make_env():
+    scheme, environ = {}, {}
+    for i in range(VARIABLES):
+        cast, value = CASTS[i % len(CASTS)]
+        name = 'VAR_{}'.format(i)
+        scheme[name] = cast
+        environ[name] = value
+
+    env = Env(**scheme)
+    env.ENVIRON = environ
+    return env
+
+
+def main():
+    env = make_env()
+    names = list(env.scheme)
+
+    def legacy():
+        for name in names:
+            legacy_get_value(env, name)
+
+    def compiled():
+        for name in names:
+            env(name)
+
+    report('Resolve {} scheme variables'.format(VARIABLES), [
+        ('legacy scheme lookup', measure(legacy, number=100)),
+        ('compiled plans', measure(compiled, number=100)),
+    ])
+    report('Compile {} scheme variables'.format(VARIABLES), [
+        ('Env.compile()', measure(env.compile, number=100)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Compare lookups against an environment snapshot and os.environ."""
+
+import os
+
+from environ import Env
+from . import measure, report
+
+VARIABLES = 200
+
+
+def main():
+    names = ['BENCH_SNAPSHOT_{}'.format(i) for i in range(VARIABLES)]
+    for name in names:
+        os.environ[name] = 'value'
+
+    snapshot = Env.snapshot()
+
+    def lookup(environ):
+        def func():
+            for name in names:
+                environ[name]  # pylint: disable=pointless-statement
+        return func
+
+    report('Look up {} variables'.format(VARIABLES), [
+        ('os.environ', measure(lookup(os.environ))),
+        ('Env.snapshot()', measure(lookup(snapshot))),
+    ])
+
+    env, bound = Env(), Env()
+    bound.ENVIRON = snapshot
+
+    def get_value(instance):
+        def func():
+            for name in names:
+                instance.str(name)
+        return func
+
+    report('Env.str() over {} variables'.format(VARIABLES), [
+        ('os.environ', measure(get_value(env), number=200)),
+        ('Env.snapshot()', measure(get_value(bound), number=200)),
+    ])
+
+    report('Take a snapshot of {} variables'.format(len(os.environ)), [
+        ('Env.snapshot()', measure(Env.snapshot)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
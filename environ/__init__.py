@@ -13,12 +13,21 @@ package info used by various functions within django-environ-2.
 
 Modules:
 
+    aio
     compat
     environ
 
 Classes:
 
+    AccessStats
+    AsyncEnv
+    AsyncSource
+    CacheInfo
     Env
+    EnvironSnapshot
+    EnvironSource
+    FileSource
+    LazyMapping
     NoValue
     Path
 
@@ -41,9 +50,30 @@ Refer to the `documentation <https://django-environ-2.readthedocs.io/>`_
 for details on the use of this package.
 """
 
+import sys
+
+from . import compat
 from .environ import *
 
 
+def __getattr__(name):
+    # Resolve compat names lazily, see environ.compat
+    if name in ('DJANGO_POSTGRES', 'REDIS_DRIVER'):
+        return getattr(compat, name)
+    # Import asyncio only when asynchronous lookups are used
+    if name in ('AsyncEnv', 'AsyncSource', 'EnvironSource', 'FileSource'):
+        from . import aio
+        return getattr(aio, name)
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is not supported (PEP 562)
+    from .compat import DJANGO_POSTGRES, REDIS_DRIVER
+    from .aio import AsyncEnv, AsyncSource, EnvironSource, FileSource
+
+
 __copyright__ = 'Copyright (C) 2021 Serghei Iakovlev'
 __version__ = '2.3.0'
 __license__ = 'MIT'
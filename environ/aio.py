@@ -0,0 +1,381 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+"""Resolve variables from asynchronous sources without blocking.
+
+Importing this module imports ``asyncio``, so it is not imported by
+``import environ`` but on first access of one of its names.
+"""
+
+import asyncio
+import copy
+import os
+
+from . import compat
+from .environ import (
+    Env,
+    _parse_template,
+    _read_secret_file,
+    _template_references,
+)
+
+__all__ = ['AsyncEnv', 'AsyncSource', 'EnvironSource', 'FileSource']
+
+
+class AsyncSource:
+
+    """Base class of the asynchronous sources of raw values of `AsyncEnv`.
+
+    Subclasses implement `get`, or `get_many` to fetch many variables in a
+    single round trip, e.g. from a key-value store::
+
+        class RedisSource(AsyncSource):
+            def __init__(self, client, prefix='config:', timeout=None):
+                super().__init__(timeout=timeout)
+                self.client, self.prefix = client, prefix
+
+            async def get_many(self, names):
+                values = await self.client.mget(
+                    [self.prefix + name for name in names])
+                return {name: value.decode() for name, value
+                        in zip(names, values) if value is not None}
+
+    :param timeout: Seconds to wait for the values of a single lookup,
+        ``None`` to wait forever.
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+
+    async def get(self, var):
+        """Return the raw value of `var`, or ``None`` if it is not set."""
+        raise NotImplementedError
+
+    async def get_many(self, names):
+        """Return a dict of the raw values of those `names` which are set."""
+        values = await asyncio.gather(*(self.get(name) for name in names))
+        return {
+            name: value for name, value in zip(names, values)
+            if value is not None
+        }
+
+    def __repr__(self):
+        return '<{}>'.format(type(self).__name__)
+
+
+class EnvironSource(AsyncSource):
+
+    """Read values from a mapping, ``Env.ENVIRON`` by default."""
+
+    def __init__(self, environ=None, timeout=None):
+        super().__init__(timeout=timeout)
+        self.environ = environ
+
+    async def get(self, var):
+        environ = Env.ENVIRON if self.environ is None else self.environ
+        return environ.get(var)
+
+    async def get_many(self, names):
+        # Nothing to wait for, look all names up at once
+        environ = Env.ENVIRON if self.environ is None else self.environ
+        return {name: environ[name] for name in names if name in environ}
+
+
+class FileSource(AsyncSource):
+
+    """Read values from files named after the variables in a directory.
+
+    Secrets and config maps mounted by orchestrators, e.g. in
+    ``/run/secrets``, are read in a thread pool and cached like the
+    ``<VAR>_FILE`` files of ``Env(secret_files=True)``.
+    """
+
+    def __init__(self, directory, timeout=None):
+        super().__init__(timeout=timeout)
+        self.directory = str(directory)
+
+    def _read(self, var):
+        if os.sep in var or (os.altsep and os.altsep in var) or \
+                var in (os.curdir, os.pardir):
+            return None
+        try:
+            return _read_secret_file(os.path.join(self.directory, var))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    async def get(self, var):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._read, var)
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(type(self).__name__, self.directory)
+
+
+async def _fetch_from_source(source, names):
+    try:
+        return await asyncio.wait_for(source.get_many(names), source.timeout)
+    except asyncio.TimeoutError as exc:
+        raise compat.ImproperlyConfigured(
+            'Timed out after {}s reading environment variables from '
+            '{!r}'.format(source.timeout, source)) from exc
+    except (OSError, UnicodeDecodeError) as exc:
+        raise compat.ImproperlyConfigured(
+            'Unable to read environment variables from {!r}: {}'.format(
+                source, exc)) from exc
+
+
+def _references(values):
+    """Return the names of the variables referenced by `values`."""
+    names = set()
+    for value in values:
+        if not isinstance(value, str) or '$' not in value:
+            continue
+        if '${' in value:
+            names.update(_template_references(_parse_template(value)[0]))
+        elif value.startswith('$'):
+            names.add(value.lstrip('$'))
+    return names
+
+
+class AsyncEnv:
+
+    """Asynchronous counterpart of :class:`Env` for ASGI applications.
+
+    Lookups fan out to all `sources` concurrently, each bounded by its own
+    timeout, and the first source holding a variable takes precedence.
+    The raw values are then casted exactly like :class:`Env` does, so the
+    scheme, casts and ``*_url_config`` methods behave the same::
+
+        env = AsyncEnv(
+            EnvironSource(),
+            FileSource('/run/secrets', timeout=1),
+            DEBUG=(bool, False),
+        )
+        DEBUG = await env('DEBUG')
+        DATABASES = {'default': await env.db()}
+
+    :param sources: The sources to read values from, in order of
+        precedence.  Defaults to an :class:`EnvironSource`.
+    :param interpolate: Resolve ``$VAR`` and ``${VAR}`` references, which
+        are looked up in the sources as well.
+    :param env_cls: The :class:`Env` class, or subclass with custom casts,
+        used to cast values.
+    """
+
+    NOTSET = Env.NOTSET
+
+    def __init__(self, *sources, interpolate=False, env_cls=None, **scheme):
+        self.sources = sources or (EnvironSource(),)
+        self.env = (env_cls or Env)(interpolate=interpolate, **scheme)
+
+    @property
+    def scheme(self):
+        return self.env.scheme
+
+    async def _fetch(self, names):
+        """Fetch the raw values of `names` from all sources concurrently.
+
+        Sources are queried at once but their results are used in order of
+        precedence, and sources of lower precedence are cancelled as soon
+        as all `names` are found.  The error of a source is raised only if
+        it might have held one of the `names` which were not found yet.
+        """
+        names = list(names)
+        tasks = [
+            asyncio.ensure_future(_fetch_from_source(source, names))
+            for source in self.sources
+        ]
+
+        values = {}
+        try:
+            for task in tasks:
+                try:
+                    result = await task
+                except compat.ImproperlyConfigured:
+                    if len(values) < len(names):
+                        raise
+                    continue
+
+                for name, value in result.items():
+                    values.setdefault(name, value)
+                if len(values) == len(names):
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+            for task in tasks:
+                if not task.cancelled():
+                    # Mark errors of unused sources as retrieved
+                    task.exception()
+
+        return values
+
+    async def _bind(self, names, defaults=()):
+        """Return an :class:`Env` bound to the values of `names`."""
+        names = set(names)
+        values = await self._fetch(names)
+
+        if self.env.interpolate:
+            pending = _references(
+                list(values.values()) + list(defaults)) - names
+            while pending:
+                names |= pending
+                fetched = await self._fetch(pending)
+                values.update(fetched)
+                pending = _references(fetched.values()) - names
+
+        env = copy.copy(self.env)
+        env.ENVIRON = values
+        return env
+
+    async def _lookup(self, method, var, default, *args, **kwargs):
+        env = await self._bind((var,), (default,))
+        return getattr(env, method)(var, *args, default=default, **kwargs)
+
+    async def __call__(self, var, cast=None, default=NOTSET,
+                       parse_default=False):
+        return await self.get_value(
+            var, cast=cast, default=default, parse_default=parse_default)
+
+    async def get_value(self, var, cast=None, default=NOTSET,
+                        parse_default=False):
+        """Return value for given environment variable, see `Env.get_value`.
+        """
+        return await self._lookup(
+            'get_value', var, default, cast=cast, parse_default=parse_default)
+
+    async def resolve(self):
+        """Resolve all variables of the scheme, see `Env.resolve`."""
+        return await self.resolve_many(self.scheme)
+
+    async def resolve_many(self, schema):
+        """Resolve all variables of the given schema in one pass.
+
+        All variables are fetched from all sources concurrently, then
+        casted and reported as `Env.resolve_many` does.
+
+        :param schema: Mapping of variable names to a cast or a
+            ``(cast, default)`` pair.
+        :returns: Dictionary mapping variable names to their values.
+        :raises ImproperlyConfigured: listing every variable which is
+            missing or could not be casted.
+        """
+        defaults = [
+            var_info[1] for var_info in schema.values()
+            if isinstance(var_info, tuple) and len(var_info) == 2
+        ]
+        env = await self._bind(schema, defaults)
+        if schema is self.scheme:
+            return env.resolve()
+        return env.resolve_many(schema)
+
+    # Shortcuts
+
+    async def str(self, var, default=NOTSET, multiline=False):
+        """
+        :rtype: str
+        """
+        return await self._lookup('str', var, default, multiline=multiline)
+
+    async def bytes(self, var, default=NOTSET, encoding='utf8'):
+        """
+        :rtype: bytes
+        """
+        return await self._lookup('bytes', var, default, encoding=encoding)
+
+    async def bool(self, var, default=NOTSET):
+        """
+        :rtype: bool
+        """
+        return await self._lookup('bool', var, default)
+
+    async def int(self, var, default=NOTSET):
+        """
+        :rtype: int
+        """
+        return await self._lookup('int', var, default)
+
+    async def float(self, var, default=NOTSET):
+        """
+        :rtype: float
+        """
+        return await self._lookup('float', var, default)
+
+    async def json(self, var, default=NOTSET):
+        """
+        :returns: Json parsed
+        """
+        return await self._lookup('json', var, default)
+
+    async def list(self, var, cast=None, default=NOTSET):
+        """
+        :rtype: list
+        """
+        return await self._lookup('list', var, default, cast=cast)
+
+    async def tuple(self, var, cast=None, default=NOTSET):
+        """
+        :rtype: tuple
+        """
+        return await self._lookup('tuple', var, default, cast=cast)
+
+    async def dict(self, var, cast=dict, default=NOTSET):
+        """
+        :rtype: dict
+        """
+        return await self._lookup('dict', var, default, cast=cast)
+
+    async def url(self, var, default=NOTSET):
+        """
+        :rtype: urlparse.ParseResult
+        """
+        return await self._lookup('url', var, default)
+
+    async def db_url(self, var=Env.DEFAULT_DATABASE_ENV, default=NOTSET,
+                     engine=None):
+        """Returns a config dictionary, defaulting to DATABASE_URL.
+
+        :rtype: dict
+        """
+        return await self._lookup('db_url', var, default, engine=engine)
+    db = db_url
+
+    async def cache_url(self, var=Env.DEFAULT_CACHE_ENV, default=NOTSET,
+                        backend=None):
+        """Returns a config dictionary, defaulting to CACHE_URL.
+
+        :rtype: dict
+        """
+        return await self._lookup('cache_url', var, default, backend=backend)
+    cache = cache_url
+
+    async def email_url(self, var=Env.DEFAULT_EMAIL_ENV, default=NOTSET,
+                        backend=None):
+        """Returns a config dictionary, defaulting to EMAIL_URL.
+
+        :rtype: dict
+        """
+        return await self._lookup('email_url', var, default, backend=backend)
+    email = email_url
+
+    async def search_url(self, var=Env.DEFAULT_SEARCH_ENV, default=NOTSET,
+                         engine=None):
+        """Returns a config dictionary, defaulting to SEARCH_URL.
+
+        :rtype: dict
+        """
+        return await self._lookup('search_url', var, default, engine=engine)
+
+    async def path(self, var, default=NOTSET, **kwargs):
+        """
+        :rtype: Path
+        """
+        return await self._lookup('path', var, default, **kwargs)
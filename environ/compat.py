@@ -6,30 +6,90 @@
 # For the full copyright and license information, please view
 # the LICENSE file that was distributed with this source code.
 
-"""This module handles import compatibility issues."""
+"""This module handles import compatibility issues.
 
-import pkgutil
+Names depending on the installed packages are resolved lazily, on first
+access, so that importing this module neither scans ``sys.path`` nor
+imports Django.
+"""
 
+import importlib.util
+import sys
 
-if pkgutil.find_loader('django'):
-    from django import VERSION as DJANGO_VERSION
-    # pylint: disable=unused-import
-    from django.core.exceptions import ImproperlyConfigured
-else:
-    DJANGO_VERSION = None
 
-    class ImproperlyConfigured(Exception):
-        """Django is somehow improperly configured."""
+def _find_spec(name):
+    """Return whether a top-level module can be imported."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-# back compatibility with django postgresql package
-if DJANGO_VERSION is not None and DJANGO_VERSION < (2, 0):
-    DJANGO_POSTGRES = 'django.db.backends.postgresql_psycopg2'
-else:
+
+def _django_version():
+    if _find_spec('django'):
+        from django import VERSION
+        return VERSION
+    return None
+
+
+class _ImproperlyConfigured(Exception):
+    """Django is somehow improperly configured."""
+
+
+# Pickle the fallback by the name it is exposed as, see __getattr__
+_ImproperlyConfigured.__name__ = 'ImproperlyConfigured'
+_ImproperlyConfigured.__qualname__ = 'ImproperlyConfigured'
+
+
+def _improperly_configured():
+    if _find_spec('django'):
+        from django.core.exceptions import ImproperlyConfigured
+        return ImproperlyConfigured
+    return _ImproperlyConfigured
+
+
+def _django_postgres():
+    # back compatibility with django postgresql package
+    django_version = _django_version()
+    if django_version is not None and django_version < (2, 0):
+        return 'django.db.backends.postgresql_psycopg2'
     # https://docs.djangoproject.com/en/2.0/releases/2.0/#id1
-    DJANGO_POSTGRES = 'django.db.backends.postgresql'
+    return 'django.db.backends.postgresql'
+
+
+def _redis_driver():
+    # back compatibility with redis_cache package
+    if _find_spec('redis_cache'):
+        return 'redis_cache.RedisCache'
+    return 'django_redis.cache.RedisCache'
+
+
+_LAZY_NAMES = {
+    'DJANGO_VERSION': _django_version,
+    'DJANGO_POSTGRES': _django_postgres,
+    'ImproperlyConfigured': _improperly_configured,
+    'REDIS_DRIVER': _redis_driver,
+}
+
+
+def __getattr__(name):
+    try:
+        factory = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+        ) from None
+
+    # Keep the first value if resolved concurrently, so that every caller
+    # gets the very same ImproperlyConfigured class
+    return globals().setdefault(name, factory())
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
 
-# back compatibility with redis_cache package
-if pkgutil.find_loader('redis_cache'):
-    REDIS_DRIVER = 'redis_cache.RedisCache'
-else:
-    REDIS_DRIVER = 'django_redis.cache.RedisCache'
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is not supported (PEP 562)
+    for _name in _LAZY_NAMES:
+        __getattr__(_name)
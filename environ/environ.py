@@ -14,12 +14,19 @@ variables to configure your Django application.
 """
 
 import ast
+import functools
 import json
+import locale
 import logging
 import os
 import re
-import urllib.parse as urlparselib
+import sys
+import threading
+import time
 import warnings
+from collections import namedtuple
+from collections.abc import Mapping
+from keyword import iskeyword
 from pathlib import PosixPath, WindowsPath
 from urllib.parse import (
     parse_qs,
@@ -27,29 +34,266 @@ from urllib.parse import (
     unquote_plus,
     urlparse,
     urlunparse,
+    uses_params,
 )
 
-from .compat import DJANGO_POSTGRES, ImproperlyConfigured, REDIS_DRIVER
+from . import compat
 
 logger = logging.getLogger(__name__)
 
 
 __all__ = [
-    'DJANGO_POSTGRES', 'REDIS_DRIVER',
-    'logger', 'NoValue', 'Env', 'Path',
+    'logger', 'AccessStats', 'CacheInfo', 'NoValue', 'Env', 'EnvironSnapshot',
+    'LazyMapping', 'Path',
 ]
 
 
+def __getattr__(name):
+    # Resolve compat names lazily, see environ.compat
+    if name in ('DJANGO_POSTGRES', 'REDIS_DRIVER', 'ImproperlyConfigured'):
+        return getattr(compat, name)
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is not supported (PEP 562)
+    from .compat import (  # noqa: F401 pylint: disable=ungrouped-imports
+        DJANGO_POSTGRES,
+        ImproperlyConfigured,
+        REDIS_DRIVER,
+    )
+
+
+class _CompatValue:
+
+    """Placeholder for a value resolved lazily from environ.compat."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def resolve(self):
+        return getattr(compat, self.name)
+
+
+class _LazySchemes:
+
+    """A class attribute holding a dict of schemes.
+
+    Values depending on the installed packages are given as
+    :class:`_CompatValue` and resolved on first access of the attribute,
+    which is then replaced by the resolved dict.
+    """
+
+    def __init__(self, schemes):
+        self.schemes = schemes
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def keys(self):
+        return self.schemes.keys()
+
+    def __get__(self, instance, owner):
+        schemes = {
+            key: val.resolve() if isinstance(val, _CompatValue) else val
+            for key, val in self.schemes.items()
+        }
+
+        # Replace the attribute on the class defining it, so that the dict
+        # is shared with all subclasses
+        for cls in owner.__mro__:
+            if cls.__dict__.get(self.name) is self:
+                setattr(cls, self.name, schemes)
+                break
+
+        return schemes
+
+
+_LITERAL_CONSTANTS = {'True': True, 'False': False, 'None': None}
+
+# Literals which evaluate the same with int(), float() or by stripping the
+# quotes.  Anything else, including underscores, leading zeros, escapes and
+# very long integers, is left to literal_eval.
+_LITERAL = re.compile(r"""(?:
+    (?P<int>[-+]?(?:0|[1-9][0-9]{0,17}))
+    |(?P<float>[-+]?(?:(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?
+                      |[0-9]+[eE][-+]?[0-9]+))
+    |(?P<str>'[^'\\\r\n\x00\ud800-\udfff]*'|"[^"\\\r\n\x00\ud800-\udfff]*")
+    )\Z""", re.VERBOSE)
+
+
 def _cast(value):
     # Safely evaluate an expression node or a string containing a Python
     # literal or container display.
     # https://docs.python.org/3/library/ast.html#ast.literal_eval
+    if isinstance(value, str):
+        try:
+            return _LITERAL_CONSTANTS[value]
+        except KeyError:
+            pass
+
+        match = _LITERAL.match(value)
+        if match is not None:
+            kind = match.lastgroup
+            if kind == 'int':
+                return int(value)
+            if kind == 'float':
+                return float(value)
+            return value[1:-1]
+
+        # A bare name is not a literal
+        if value.isidentifier() and not iskeyword(value):
+            return value
+
     try:
         return ast.literal_eval(value)
     except ValueError:
         return value
 
 
+class _ParseResult(ParseResult):
+
+    """A parsed URL of a registered scheme, see :func:`_urlparse`."""
+
+    __slots__ = ()
+
+    def geturl(self):
+        if self.netloc or self.scheme not in _URL_SCHEMES:
+            return super().geturl()
+
+        # urllib keeps the "//" of an empty netloc only for the schemes of
+        # urllib.parse.uses_netloc, such as http
+        url = urlunparse(self._replace(scheme='http'))
+        return self.scheme + url[len('http'):]
+
+
+def _urlparse(url):
+    """Parse a URL like :func:`urllib.parse.urlparse` does.
+
+    URLs of registered schemes are parsed as if the scheme was listed in
+    the ``urllib.parse.uses_*`` lists, without modifying these lists:
+    ``;params`` of the last path segment are split off, and
+    :meth:`~urllib.parse.ParseResult.geturl` keeps the ``//`` of URLs
+    with an empty host.
+
+    :rtype: urllib.parse.ParseResult
+    """
+    result = urlparse(url)
+    scheme = result.scheme
+    if scheme not in _URL_SCHEMES:
+        return result
+
+    result = _ParseResult(*result)
+    if scheme not in uses_params and ';' in result.path:
+        path = result.path
+        i = path.find(';', max(path.rfind('/'), 0))
+        if i >= 0:
+            result = result._replace(path=path[:i], params=path[i + 1:])
+    return result
+
+
+# The components of a database URL used by Env.db_url_config.
+_DSN = namedtuple('_DSN', (
+    'scheme', 'netloc', 'path', 'query',
+    'username', 'password', 'hostname', 'port',
+))
+
+# A URL of the form "scheme://netloc/path?query#fragment" with a lower case
+# scheme, anything else is left to urllib.
+_DSN_URL = re.compile(
+    r'(?P<scheme>[a-z][a-z0-9+.\-]*)://'
+    r'(?P<netloc>[^/?#]*)'
+    r'(?P<path>[^?#]*)'
+    r'(?:\?(?P<query>[^#]*))?'
+    r'(?:#.*)?\Z',
+    re.S
+)
+
+# Characters urllib strips or removes from URLs, and non-ASCII characters
+# urllib validates in netloc.
+_DSN_UNSAFE = re.compile(r'[\t\r\n]|\A[\x00-\x20]|[^\x00-\x7f]')
+
+
+def _dsn_from_parse_result(url):
+    """Return the database URL components of a parsed URL."""
+    return _DSN(
+        url.scheme, url.netloc, url.path, url.query,
+        url.username, url.password, url.hostname, url.port,
+    )
+
+
+def _parse_dsn(url):
+    """Split a database URL into its components in a single scan.
+
+    The result is identical to the one of :func:`_urlparse`; URLs using
+    syntax this parser does not handle itself, such as IPv6 hosts, are
+    passed on to it.
+
+    :rtype: _DSN
+    """
+    match = _DSN_URL.match(url)
+    if match is None or _DSN_UNSAFE.search(url):
+        return _dsn_from_parse_result(_urlparse(url))
+
+    scheme, netloc, path, query = match.group(
+        'scheme', 'netloc', 'path', 'query')
+
+    userinfo, has_userinfo, hostinfo = netloc.rpartition('@')
+    hostname, _, port = hostinfo.partition(':')
+    if '[' in netloc or ']' in netloc or '%' in hostname or \
+            (port and (not port.isdigit() or int(port) > 65535)):
+        return _dsn_from_parse_result(_urlparse(url))
+
+    if has_userinfo:
+        username, has_password, password = userinfo.partition(':')
+        if not has_password:
+            password = None
+    else:
+        username = password = None
+
+    if ';' in path and (scheme in _URL_SCHEMES or scheme in uses_params):
+        i = path.find(';', max(path.rfind('/'), 0))
+        if i >= 0:
+            path = path[:i]
+
+    return _DSN(
+        scheme,
+        netloc,
+        path,
+        query or '',
+        username,
+        password,
+        hostname.lower() or None,
+        int(port) if port else None,
+    )
+
+
+def _parse_query(query):
+    """Parse a query string into a dict of the first value of each name.
+
+    Equivalent to taking the first value of every list returned by
+    :func:`urllib.parse.parse_qs`.
+    """
+    if ';' in query:
+        # Whether ";" separates fields depends on the Python version
+        return {key: val[0] for key, val in parse_qs(query).items()}
+
+    params = {}
+    for field in query.split('&'):
+        key, _, val = field.partition('=')
+        if not val:
+            continue
+        if '%' in key or '+' in key:
+            key = unquote_plus(key)
+        if key not in params:
+            if '%' in val or '+' in val:
+                val = unquote_plus(val)
+            params[key] = val
+    return params
+
+
 def _cast_int(val):
     """Return int if possible."""
     return int(val) if hasattr(val, 'isdigit') and val.isdigit() else val
@@ -59,6 +303,664 @@ def _cast_urlstr(val):
     return unquote_plus(val) if isinstance(val, str) else val
 
 
+# Casters of the casts built into Env.parse_value.  A caster is called with
+# the Env class, the raw value and the cast it is registered for.
+
+def _parse_bool_slow(value, true_strings):
+    try:
+        return int(value) != 0
+    except ValueError:
+        return value.lower() in true_strings
+
+
+def _boolean_table(true_strings):
+    """Precompute the casts of common spellings of booleans."""
+    words = {'false', 'off', 'no', 'n', ''}
+    words.update('0123456789')
+    words.update(word for word in true_strings if isinstance(word, str))
+    spellings = {
+        spelling
+        for word in words
+        for spelling in (word, word.upper(), word.title())
+    }
+    true_strings = frozenset(true_strings)
+    table = {word: _parse_bool_slow(word, true_strings) for word in spellings}
+    return table, true_strings
+
+
+# Boolean tables by BOOLEAN_TRUE_STRINGS.
+_BOOLEAN_TABLES = {}
+
+
+def _parse_bool(cls, value, cast):
+    true_strings = cls.BOOLEAN_TRUE_STRINGS
+    try:
+        table, lookup = _BOOLEAN_TABLES[true_strings]
+    except KeyError:
+        table, lookup = _BOOLEAN_TABLES.setdefault(
+            true_strings, _boolean_table(true_strings))
+    except TypeError:
+        # Not a tuple, which may change at any time
+        return _parse_bool_slow(value, true_strings)
+
+    result = table.get(value)
+    if result is None:
+        return _parse_bool_slow(value, lookup)
+    return result
+
+
+_FLOAT_JUNK = re.compile(r'[^\d,.-]')
+_FLOAT_SEPARATORS = re.compile(r'[,.]')
+
+
+def _parse_float(cls, value, cast):
+    # Plain numbers, unless float() would read an exponent, inf or nan,
+    # which the locale aware parsing below does not support.
+    try:
+        result = float(value)
+    except ValueError:
+        pass
+    else:
+        if result - result == 0 and 'e' not in value and 'E' not in value:
+            return result
+
+    # clean string
+    float_str = _FLOAT_JUNK.sub('', value)
+    # split for avoid thousand separator and different locale comma/dot symbol
+    parts = _FLOAT_SEPARATORS.split(float_str)
+    if len(parts) == 1:
+        float_str = parts[0]
+    else:
+        float_str = "{}.{}".format(''.join(parts[0:-1]), parts[-1])
+    return float(float_str)
+
+
+def _parse_dict(cls, value, cast):
+    return dict([val.split('=') for val in value.split(',') if val])
+
+
+def _parse_list(cls, value, cast):
+    return [x for x in value.split(',') if x]
+
+
+def _parse_tuple(cls, value, cast):
+    val = value.strip('(').strip(')').split(',')
+    return tuple([x for x in val if x])
+
+
+def _parse_list_of(cls, value, cast):
+    return list(map(cast[0], [x for x in value.split(',') if x]))
+
+
+def _parse_tuple_of(cls, value, cast):
+    val = value.strip('(').strip(')').split(',')
+    return tuple(map(cast[0], [x for x in val if x]))
+
+
+def _parse_dict_of(cls, value, cast):
+    return cls._dict_cast_plan(cast)(value)
+
+
+def _compile_dict_cast(cls, cast):
+    """Compile a ``{'key': ..., 'value': ..., 'cast': {...}}`` cast.
+
+    Return a callable parsing ``key=value;...`` strings in one pass, with
+    the casters of the values resolved upfront.
+    """
+    key_cast = cast.get('key', str)
+    value_caster = cls._make_caster(cast.get('value', str)) or str
+    casters_by_key = {
+        key: cls._make_caster(value_cast) or str
+        for key, value_cast in cast.get('cast', {}).items()
+    }
+
+    # Only the first two parts of "key=value=..." are used, and a missing
+    # "=" raises IndexError, as in previous versions.  Splitting is done by
+    # str.split, which is faster than scanning with str.find in Python.
+    if not casters_by_key:
+        def parse(value):
+            return {
+                key_cast(kv[0]): value_caster(kv[1])
+                for item in value.split(';') if item
+                for kv in (item.split('=', 2),)
+            }
+    else:
+        def parse(value):
+            get_caster = casters_by_key.get
+            return {
+                key_cast(kv[0]): get_caster(kv[0], value_caster)(kv[1])
+                for item in value.split(';') if item
+                for kv in (item.split('=', 2),)
+            }
+
+    return parse
+
+
+def _iter_list_chunks(value, chunk_size=1 << 12):
+    """Yield the items of a comma-separated list in chunks.
+
+    The value is split in chunks of about `chunk_size` characters, cut at
+    commas, to bound memory without splitting item by item.  Empty items
+    are left in.
+    """
+    start, end = 0, len(value)
+    while start < end:
+        stop = value.find(',', start + chunk_size)
+        if stop < 0:
+            stop = end
+        yield value[start:stop].split(',')
+        start = stop + 1
+
+
+def _iter_list_items(value):
+    """Yield the non-empty items of a comma-separated list."""
+    for chunk in _iter_list_chunks(value):
+        yield from filter(None, chunk)
+
+
+# array.array typecodes of the numeric types supported by Env.array.
+_ARRAY_INT_TYPECODES = frozenset('bBhHiIlLqQ')
+_ARRAY_FLOAT_TYPECODES = frozenset('fd')
+
+# Marks a variable missing from ENVIRON in the value cache.
+_MISSING = object()
+
+# Hit and miss statistics of the Env value cache.
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'currsize'))
+
+# Access statistics of a variable, see Env.stats().
+AccessStats = namedtuple(
+    'AccessStats', ('accesses', 'cast_time', 'call_sites'))
+
+
+class _AccessRecord:
+    __slots__ = ('accesses', 'cast_time', 'call_sites')
+
+    def __init__(self):
+        self.accesses = 0
+        self.cast_time = 0.0
+        self.call_sites = []
+
+
+def _call_site():
+    """Return ``(filename, lineno, function)`` of the caller of Env."""
+    here = _call_site.__code__.co_filename
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    while frame is not None and frame.f_code.co_filename == here:
+        frame = frame.f_back
+    if frame is None:
+        return None
+    return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+
+
+# A precomputed resolution plan for a variable declared in the Env scheme,
+# together with the scheme entry it was compiled from.
+_SchemePlan = namedtuple(
+    '_SchemePlan', ('cast', 'default', 'caster', 'entry'))
+
+
+# A "KEY=value" line of an .env file, optionally prefixed with "export".
+_ENV_LINE = re.compile(r'(?:export )?([A-Za-z_0-9]+)=(.*)\Z')
+
+# A backslash escape in a double-quoted .env value, except \r, \n and \t
+# which are kept escaped.
+_ENV_ESCAPE = re.compile(r'\\([^rnt])')
+
+
+def _parse_env_lines(lines):
+    """Parse lines of an .env file into (key, value) pairs.
+
+    Lines which are not assignments, such as comments and blank lines,
+    are skipped.  A value wrapped in single quotes is unquoted, a value
+    wrapped in double quotes is unquoted and unescaped, keeping escaped
+    newlines and tabs as is.
+    """
+    match_line = _ENV_LINE.match
+    unescape = _ENV_ESCAPE.sub
+
+    for line in lines:
+        if not line or line[0] == '#':
+            continue
+
+        match = match_line(line)
+        if match is None:
+            continue
+
+        key, val = match.groups()
+        if len(val) > 1:
+            if val[0] == "'" and val[-1] == "'":
+                val = val[1:-1]
+            if len(val) > 1 and val[0] == '"' and val[-1] == '"':
+                val = val[1:-1]
+                if '\\' in val:
+                    val = unescape(r'\1', val)
+        yield key, val
+
+
+def _iter_env_file_lines(file, encoding=None):
+    """Yield the lines of an open .env file one at a time."""
+    for chunk in file:
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode(
+                encoding or locale.getpreferredencoding(False))
+        # Split on the same line boundaries as str.splitlines() does for
+        # the whole content
+        yield from chunk.splitlines()
+
+
+def _iter_env_mapped_lines(file, encoding=None, chunk_size=1 << 16):
+    """Yield the lines of an .env file mapped into memory.
+
+    The mapping is decoded in chunks of about `chunk_size` bytes ending at
+    a line break, so the file content is never decoded as a whole.
+    """
+    import mmap
+
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # Empty files cannot be mapped
+        return
+
+    encoding = encoding or locale.getpreferredencoding(False)
+    with mapped:
+        start, size = 0, len(mapped)
+        while start < size:
+            end = mapped.find(b'\n', min(start + chunk_size, size) - 1)
+            end = size if end == -1 else end + 1
+            yield from mapped[start:end].decode(encoding).splitlines()
+            start = end
+
+
+# The first line of every read_env parse cache file.
+_PARSE_CACHE_MAGIC = b'django-environ-2 parse cache 1\n'
+
+
+def _parse_cache_path(env_file, parse_cache):
+    """Return the path of the parse cache file of an .env file."""
+    env_file = os.path.abspath(env_file)
+    if parse_cache is True:
+        head, tail = os.path.split(env_file)
+        return os.path.join(head, '.{}.cache'.format(tail))
+
+    import hashlib
+
+    name = hashlib.sha1(env_file.encode('utf-8', 'surrogateescape'))
+    return os.path.join(str(parse_cache), name.hexdigest() + '.envcache')
+
+
+def _read_env_pairs_cached(file, cache_path, encoding=None):
+    """Return (key, value) pairs of an .env file using a parse cache.
+
+    The cache file starts with a header holding the modification time,
+    size, encoding and content hash of the .env file, followed by the
+    UTF-8 encoded keys and values separated by null characters.  The
+    cached pairs are used only if the whole header matches, otherwise the
+    file is parsed and the cache is rewritten.
+    """
+    # Imported here, like tempfile, as the parse cache is opt-in
+    import hashlib
+
+    stat = os.fstat(file.fileno())
+    content = file.read()
+    encoding = encoding or locale.getpreferredencoding(False)
+
+    header = _PARSE_CACHE_MAGIC + '{} {} {} {}\n'.format(
+        stat.st_mtime_ns,
+        stat.st_size,
+        encoding,
+        hashlib.blake2b(content).hexdigest(),
+    ).encode('utf-8')
+
+    try:
+        with open(cache_path, 'rb') as cache:
+            cached = cache.read()
+    except OSError:
+        cached = b''
+
+    if cached.startswith(header):
+        try:
+            fields = cached[len(header):].decode('utf-8').split('\0')
+        except UnicodeDecodeError:
+            pass
+        else:
+            if len(fields) % 2 == 0:
+                return list(zip(fields[::2], fields[1::2]))
+
+    pairs = list(_parse_env_lines(content.decode(encoding).splitlines()))
+    _write_parse_cache(cache_path, header, pairs)
+    return pairs
+
+
+def _write_parse_cache(cache_path, header, pairs):
+    """Atomically write parsed (key, value) pairs to a parse cache file."""
+    if not pairs or any('\0' in val for _, val in pairs):
+        # Nothing to store, or not representable in the cache format
+        return
+
+    import tempfile
+
+    payload = '\0'.join(field for pair in pairs for field in pair)
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as tmp:
+            tmp.write(header)
+            tmp.write(payload.encode('utf-8'))
+        os.replace(tmp.name, cache_path)
+    except OSError as exc:
+        logger.debug('Unable to write parse cache %s: %s', cache_path, exc)
+
+
+def _read_env_file_pairs(path, encoding=None, parse_cache=None):
+    """Read and parse an .env file into a list of (key, value) pairs."""
+    if parse_cache:
+        with open(path, 'rb') as file:
+            return _read_env_pairs_cached(
+                file,
+                _parse_cache_path(path, parse_cache),
+                encoding
+            )
+
+    with open(path, encoding=encoding) as file:
+        return list(_parse_env_lines(file.read().splitlines()))
+
+
+# Types of the values which never need to be copied out of a cache.
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _copy_result(value):
+    """Return a copy of mutable containers handed out by a cache.
+
+    Containers of immutable values, the common case, are copied shallowly
+    and others deeply, e.g. the ``OPTIONS`` dict of a database config, so
+    that modifying any part of the copy does not corrupt the cache.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    if type(value) is dict:
+        items = value.values()
+    elif type(value) in (list, set):
+        items = value
+    else:
+        return value
+
+    if all(type(item) in _IMMUTABLE_TYPES for item in items):
+        return value.copy()
+
+    import copy
+
+    return copy.deepcopy(value)
+
+
+# Marks the value cache keys built by _freeze() from unhashable arguments.
+_FROZEN = object()
+
+
+def _freeze(value):
+    """Return a hashable equivalent of a cast or default for cache keys.
+
+    Containers are converted to tuples tagged with their type, so that
+    e.g. ``[int]`` and ``(int,)`` are kept apart.
+
+    :raises TypeError: if `value` holds an unhashable object which is not
+        a container.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(map(_freeze, value))
+    if isinstance(value, dict):
+        return type(value), tuple(
+            (_freeze(key), _freeze(val)) for key, val in value.items())
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(map(_freeze, value))
+    hash(value)
+    return value
+
+
+# The LRU cache shared by the *_url_config methods of Env, see
+# Env.enable_url_config_cache().
+_url_config_cache = None
+
+
+def _build_url_config(func, cls, url, args, kwargs):
+    return func(cls, url, *args, **dict(kwargs))
+
+
+def _memoize_url_config(func):
+    """Memoize a *_url_config method in the shared URL config cache.
+
+    Configs are cached per class, URL and arguments.  Every caller gets its
+    own copy of the cached config, so that modifying it, e.g. by Django,
+    does not corrupt the cache.
+    """
+    @functools.wraps(func)
+    def wrapper(cls, url, *args, **kwargs):
+        # Always call through _build_url_config, so that the stack depth
+        # seen by warnings does not depend on caching
+        cache = _url_config_cache
+        if cache is None:
+            return _build_url_config(func, cls, url, args, kwargs.items())
+
+        try:
+            config = cache(func, cls, url, args, tuple(kwargs.items()))
+        except TypeError:
+            # Unhashable argument
+            return _build_url_config(func, cls, url, args, kwargs.items())
+
+        return {key: _copy_result(val) for key, val in config.items()}
+
+    return wrapper
+
+
+# Contents of secret files read for <VAR>_FILE variables, by path, together
+# with the (device, inode, mtime, size) of the file they were read from.
+_secret_files = {}
+
+
+def _read_secret_file(path, encoding=None):
+    """Return the contents of a secret file, without trailing newlines.
+
+    The contents are cached and reused while the file keeps its device,
+    inode, modification time and size, so that repeated lookups only stat
+    the file.  Rotating a secret, e.g. by replacing the file or swapping a
+    symlink as Kubernetes does, invalidates the entry.
+    """
+    stat = os.stat(path)
+    entry = _secret_files.get(path)
+    if entry is not None and entry[0] == (
+            stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size):
+        return entry[1]
+
+    with open(path, encoding=encoding) as file:
+        # Identify the file actually read, it may be replaced since stat()
+        stat = os.fstat(file.fileno())
+        contents = file.read().rstrip('\r\n')
+
+    _secret_files[path] = (
+        (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size), contents)
+    return contents
+
+
+# The (env, var) pairs whose $VAR proxies are being resolved, per thread.
+_proxy_chains = threading.local()
+
+# The start of a ${VAR} or ${VAR:-default} reference, or a closing brace.
+_TEMPLATE_TOKEN = re.compile(
+    r'\$\{([A-Za-z_][A-Za-z_0-9]*)(?:(\})|:-)|(\})')
+
+
+def _parse_template(value, pos=0, nested=False):
+    """Split `value` into literal text and ``(name, default)`` references.
+
+    Defaults are parsed recursively, so that they may hold references
+    themselves, e.g. ``${MEDIA_DIR:-${BASE_DIR}/media}``.  A default is
+    ``None`` for references without one.  Text which is not a complete
+    reference, such as an unterminated ``${VAR:-``, is kept literally.
+
+    :param nested: Whether a default is parsed, which ends at the first
+        unmatched ``}``.
+    :returns: A tuple of the parts and the position after the parsed text,
+        or ``(None, None)`` if `nested` and the default is unterminated.
+    """
+    parts, text = [], pos
+    while True:
+        match = _TEMPLATE_TOKEN.search(value, pos)
+        if match is None:
+            if nested:
+                return None, None
+            parts.append(value[text:])
+            return [part for part in parts if part != ''], len(value)
+
+        name, closed, brace = match.groups()
+        if brace is not None:
+            if nested:
+                parts.append(value[text:match.start()])
+                return [part for part in parts if part != ''], match.end()
+            pos = match.end()
+        elif closed is not None:
+            parts.extend((value[text:match.start()], (name, None)))
+            pos = text = match.end()
+        else:
+            default, end = _parse_template(value, match.end(), nested=True)
+            if default is None:
+                # Unterminated default, keep the "${VAR:-" as is
+                pos = match.end()
+                continue
+            parts.extend((value[text:match.start()], (name, default)))
+            pos = text = end
+
+
+def _template_references(parts):
+    """Yield the names referenced by parsed template `parts`."""
+    for part in parts:
+        if not isinstance(part, str):
+            name, default = part
+            yield name
+            if default is not None:
+                yield from _template_references(default)
+
+
+def _interpolate(names, lookup):
+    """Resolve the ``${VAR}`` and ``${VAR:-default}`` references of `names`.
+
+    The references form a dependency graph which is walked depth first, so
+    that every variable is resolved once, after all variables it refers
+    to.  A default is used when the variable it belongs to is unset or
+    empty, and may refer to other variables as well.
+
+    :param names: The names of the variables to resolve.
+    :param lookup: A callable returning the raw value of a variable, or
+        ``_MISSING`` when it is not set.
+    :returns: Dictionary mapping `names`, and the variables they refer to,
+        to their resolved values, ``_MISSING`` for unset variables.
+    :raises ImproperlyConfigured: if references are circular, or refer to
+        an unset variable without a default.
+    """
+    resolved = {}
+    for root in names:
+        if root in resolved:
+            continue
+
+        value = lookup(root)
+        if value is _MISSING:
+            resolved[root] = _MISSING
+            continue
+
+        parsed = {root: _parse_template(value)[0]}
+        path = [root]
+        stack = [_template_references(parsed[root])]
+        while stack:
+            for ref in stack[-1]:
+                if ref in resolved:
+                    continue
+                if ref in path:
+                    cycle = path[path.index(ref):] + [ref]
+                    raise compat.ImproperlyConfigured(
+                        'Circular reference in environment variables: '
+                        '{}'.format(' -> '.join(cycle)))
+
+                value = lookup(ref)
+                if value is _MISSING or '${' not in value:
+                    resolved[ref] = value
+                    continue
+
+                parsed[ref] = _parse_template(value)[0]
+                path.append(ref)
+                stack.append(_template_references(parsed[ref]))
+                break
+            else:
+                stack.pop()
+                name = path.pop()
+                resolved[name] = _substitute(name, parsed[name], resolved)
+
+    return resolved
+
+
+def _substitute(name, parts, resolved):
+    """Join parsed template `parts` with references `resolved`."""
+    chunks = []
+    for part in parts:
+        if isinstance(part, str):
+            chunks.append(part)
+            continue
+
+        ref, default = part
+        replacement = resolved.get(ref, _MISSING)
+        if default is not None and \
+                (replacement is _MISSING or replacement == ''):
+            replacement = _substitute(name, default, resolved)
+        elif replacement is _MISSING:
+            raise compat.ImproperlyConfigured(
+                'Set the {} environment variable, referenced by {}'.format(
+                    ref, name))
+        chunks.append(replacement)
+
+    return ''.join(chunks)
+
+
+def _interpolate_pairs(pairs, environ, overwrite=False, overrides=None):
+    """Resolve the references of .env `pairs` about to be set in `environ`.
+
+    References see the values the variables will have afterwards, i.e.
+    `overrides` first, then either the file or `environ`, depending on
+    `overwrite`.
+
+    :returns: A list of pairs with their values resolved.
+    """
+    pairs = list(pairs)
+    overrides = overrides or {}
+    values = {}
+    for key, val in pairs:
+        if overwrite:
+            values[key] = val
+        else:
+            values.setdefault(key, val)
+
+    def lookup(name):
+        if name in overrides:
+            return str(overrides[name])
+        if overwrite or name not in environ:
+            value = values.get(name, _MISSING)
+            if value is not _MISSING:
+                return value
+        return environ.get(name, _MISSING)
+
+    # Only values which will actually be set need to be resolved
+    names = [
+        key for key in values
+        if '${' in values[key] and (overwrite or key not in environ)
+    ]
+    if not names:
+        return pairs
+
+    resolved = _interpolate(names, lookup)
+    return [
+        (key, resolved[key]) if key in resolved and '${' in val else
+        (key, val)
+        for key, val in pairs
+    ]
+
+
 def _make_setenv(env, overwrite=False):
     """
     Return lambda to set environ.
@@ -66,10 +968,113 @@ def _make_setenv(env, overwrite=False):
     Use setdefault unless overwrite is specified.
     """
     if overwrite:
-        return lambda k, v: env.update({k: str(v)})
+        return lambda k, v: env.__setitem__(k, str(v))
     return lambda k, v: env.setdefault(k, str(v))
 
 
+class EnvironSnapshot(dict):
+
+    """An immutable copy of the environment backed by a plain dict.
+
+    Lookups are plain dict lookups without the key encoding and value
+    decoding done by ``os.environ``.  The snapshot never changes after it
+    was taken, so readers bound to it never observe a partially applied
+    ``read_env``.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('{} is read-only'.format(self.__class__.__name__))
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __repr__(self):
+        return '<{}: {} variables>'.format(self.__class__.__name__, len(self))
+
+
+class LazyMapping(Mapping):
+
+    """A read-only mapping casting its values on first access.
+
+    The keys of the raw ``key=value`` string are parsed upfront, while each
+    value is cast only when it is looked up for the first time, and cached
+    from then on.  Malformed entries raise on construction, like they do
+    with :meth:`Env.dict`.
+
+    :param value: The raw value, as stored in the environment.
+    :param cast: ``dict`` or a ``{'key': ..., 'value': ..., 'cast': {...}}``
+        dict cast, see :meth:`Env.dict`.
+    :param env_cls: The Env class whose casters are used.
+    """
+
+    def __init__(self, value, cast=dict, env_cls=None):
+        if env_cls is None:
+            env_cls = Env
+
+        if cast is dict:
+            # Values of plain dict casts are strings, nothing to cast
+            self._value_caster = str
+            self._casters_by_key = {}
+            self._index = {
+                key: (key, val)
+                for key, val in dict(
+                    [item.split('=') for item in value.split(',') if item]
+                ).items()
+            }
+        elif isinstance(cast, dict):
+            key_cast = cast.get('key', str)
+            self._value_caster = \
+                env_cls._make_caster(cast.get('value', str)) or str
+            self._casters_by_key = {
+                key: env_cls._make_caster(value_cast) or str
+                for key, value_cast in cast.get('cast', {}).items()
+            }
+            # Keep the raw key to look up its cast, and the raw value
+            self._index = {
+                key_cast(kv[0]): (kv[0], kv[1])
+                for item in value.split(';') if item
+                for kv in (item.split('=', 2),)
+            }
+        else:
+            raise TypeError(
+                'Expected dict or a dict cast, got {!r}'.format(cast))
+
+        self._values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        raw_key, raw_value = self._index[key]
+        caster = self._casters_by_key.get(raw_key, self._value_caster)
+        value = self._values[key] = caster(raw_value)
+        return value
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return '<{}: {} keys, {} cast>'.format(
+            self.__class__.__name__, len(self._index), len(self._values))
+
+
 class NoValue:
 
     def __repr__(self):
@@ -95,11 +1100,11 @@ class Env:
     DEFAULT_DATABASE_ENV = 'DATABASE_URL'
 
     POSTGRES_FAMILY = ['postgres', 'postgresql', 'psql', 'pgsql', 'postgis']
-    DB_SCHEMES = {
-        'postgres': DJANGO_POSTGRES,
-        'postgresql': DJANGO_POSTGRES,
-        'psql': DJANGO_POSTGRES,
-        'pgsql': DJANGO_POSTGRES,
+    DB_SCHEMES = _LazySchemes({
+        'postgres': _CompatValue('DJANGO_POSTGRES'),
+        'postgresql': _CompatValue('DJANGO_POSTGRES'),
+        'psql': _CompatValue('DJANGO_POSTGRES'),
+        'pgsql': _CompatValue('DJANGO_POSTGRES'),
         'postgis': 'django.contrib.gis.db.backends.postgis',
         'mysql': 'django.db.backends.mysql',
         'mysql2': 'django.db.backends.mysql',
@@ -112,7 +1117,7 @@ class Env:
         'spatialite': 'django.contrib.gis.db.backends.spatialite',
         'sqlite': 'django.db.backends.sqlite3',
         'ldap': 'ldapdb.backends.ldap',
-    }
+    })
     _DB_BASE_OPTIONS = [
         'CONN_MAX_AGE',
         'ATOMIC_REQUESTS',
@@ -121,17 +1126,17 @@ class Env:
     ]
 
     DEFAULT_CACHE_ENV = 'CACHE_URL'
-    CACHE_SCHEMES = {
+    CACHE_SCHEMES = _LazySchemes({
         'dbcache': 'django.core.cache.backends.db.DatabaseCache',
         'dummycache': 'django.core.cache.backends.dummy.DummyCache',
         'filecache': 'django.core.cache.backends.filebased.FileBasedCache',
         'locmemcache': 'django.core.cache.backends.locmem.LocMemCache',
         'memcache': 'django.core.cache.backends.memcached.MemcachedCache',
         'pymemcache': 'django.core.cache.backends.memcached.PyLibMCCache',
-        'rediscache': REDIS_DRIVER,
-        'redis': REDIS_DRIVER,
-        'rediss': REDIS_DRIVER,
-    }
+        'rediscache': _CompatValue('REDIS_DRIVER'),
+        'redis': _CompatValue('REDIS_DRIVER'),
+        'rediss': _CompatValue('REDIS_DRIVER'),
+    })
     _CACHE_BASE_OPTIONS = [
         'TIMEOUT',
         'KEY_PREFIX',
@@ -177,10 +1182,51 @@ class Env:
         'simple': 'haystack.backends.simple_backend.SimpleEngine',
     }
 
-    def __init__(self, interpolate=False, **scheme):
+    # Suffix of variables holding the path of a file with the value
+    FILE_SUFFIX = '_FILE'
+
+    # Casters registered on this very class and dispatched on the cast
+    # itself, e.g. ``cast=bool``, see register_cast()
+    _OWN_CASTERS = {
+        bool: _parse_bool,
+        float: _parse_float,
+        dict: _parse_dict,
+        list: _parse_list,
+        tuple: _parse_tuple,
+    }
+    # Casters registered on this very class and dispatched on the type of
+    # the cast, e.g. ``cast=[int]``, see register_cast_kind()
+    _OWN_CAST_KINDS = {
+        list: _parse_list_of,
+        tuple: _parse_tuple_of,
+        dict: _parse_dict_of,
+    }
+    # The casters of this class and its base classes, see _update_casters()
+    _CASTERS = dict(_OWN_CASTERS)
+    _CAST_KINDS = dict(_OWN_CAST_KINDS)
+    # Casters of _CAST_KINDS resolved per type of cast
+    _cast_kind_cache = {}
+    # Compiled dict casts per frozen cast, see _dict_cast_plan()
+    _dict_cast_cache = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._OWN_CASTERS = dict(vars(cls).get('_CASTERS', {}))
+        cls._OWN_CAST_KINDS = dict(vars(cls).get('_CAST_KINDS', {}))
+        cls._update_casters()
+
+    def __init__(self, interpolate=False, cache=False, secret_files=False,
+                 **scheme):
         self.smart_cast = True
         self.interpolate = interpolate
+        self.secret_files = secret_files
         self.scheme = scheme
+        self._plans = {}
+        self._value_cache = {} if cache else None
+        self._cache_hits = self._cache_misses = 0
+        self._stats = None
+        self._max_call_sites = 0
+        self.compile()
 
     def __call__(self, var, cast=None, default=NOTSET, parse_default=False):
         return self.get_value(
@@ -193,6 +1239,326 @@ class Env:
     def __contains__(self, var):
         return var in self.ENVIRON
 
+    def compile(self):
+        """Compile the scheme into per-variable resolution plans.
+
+        Every declared variable is resolved once into its cast, its default
+        and a callable used to cast raw values, so that lookups of scheme
+        variables do not need to inspect the scheme entry again.  This is
+        called by the constructor.  Entries of :attr:`scheme` added or
+        replaced later are compiled on their first lookup.
+        """
+        self._plans = {
+            var: self._compile_scheme_entry(var_info)
+            for var, var_info in self.scheme.items()
+        }
+        if self._value_cache is not None:
+            self.cache_clear()
+
+    def _compile_scheme_entry(self, var_info):
+        cast, default = var_info, self.NOTSET
+
+        # A dict entry is a dict cast specification, not (cast, default).
+        if not isinstance(var_info, dict):
+            try:
+                has_default = len(var_info) == 2
+            except TypeError:
+                has_default = False
+
+            if has_default:
+                cast, default = var_info[0], var_info[1]
+
+        return _SchemePlan(cast, default, self._make_caster(cast), var_info)
+
+    @classmethod
+    def _make_caster(cls, cast):
+        """Return a callable casting a raw value with the given cast.
+
+        Plain callables are returned as is, dict casts are compiled and
+        other casts with a registered caster are bound to it.  Subclasses
+        overriding :meth:`parse_value` get it bound to the cast instead.
+        """
+        if cast is None:
+            return None
+        # Pass the cast by position, as parse_value does, whatever the
+        # name of the parameter
+        if getattr(cls.parse_value, '__func__', None) is not \
+                Env.parse_value.__func__:
+            parse_value = cls.parse_value
+            return lambda value: parse_value(value, cast)
+        caster = cls._find_caster(cast)
+        if caster is None:
+            return cast
+        if caster is _parse_dict_of:
+            return cls._dict_cast_plan(cast)
+        return lambda value: caster(cls, value, cast)
+
+    @classmethod
+    def _dict_cast_plan(cls, cast):
+        """Return the compiled parser of a dict cast, compiling it once."""
+        try:
+            key = _freeze(cast)
+        except TypeError:
+            return _compile_dict_cast(cls, cast)
+        try:
+            return cls._dict_cast_cache[key]
+        except KeyError:
+            plan = cls._dict_cast_cache[key] = _compile_dict_cast(cls, cast)
+            return plan
+
+    @classmethod
+    def _find_caster(cls, cast):
+        """Return the caster registered for the type of `cast` or `cast`.
+
+        Casts are dispatched on their type first, so that unhashable casts
+        such as ``[int]`` or ``{'value': int}`` are never hashed.
+        """
+        try:
+            caster = cls._cast_kind_cache[type(cast)]
+        except KeyError:
+            caster = cls._cache_cast_kind(type(cast))
+        if caster is None:
+            try:
+                caster = cls._CASTERS.get(cast)
+            except TypeError:
+                pass
+        return caster
+
+    @classmethod
+    def _cache_cast_kind(cls, kind):
+        # Resolve the caster of a type once, honouring its base classes
+        kinds = cls._CAST_KINDS
+        caster = next(
+            (kinds[base] for base in kind.__mro__ if base in kinds), None)
+        cls._cast_kind_cache[kind] = caster
+        return caster
+
+    @classmethod
+    def register_cast(cls, cast, caster):
+        """Register a caster for the given cast.
+
+        ``env(var, cast=cast)`` then returns ``caster(cls, value, cast)``,
+        where `cls` is the Env class and `value` the raw value, instead of
+        ``cast(value)``.  Registering on a subclass of Env does not affect
+        its base classes, while registering on a class affects all its
+        subclasses, including existing ones.  Schemes of existing instances
+        keep their casters until :meth:`compile` is called again.
+
+        :param cast: A hashable cast, e.g. a type or a function.
+        :param caster: A callable with the signature
+            ``caster(cls, value, cast)``.
+        """
+        cls._OWN_CASTERS[cast] = caster
+        cls._update_casters()
+
+    @classmethod
+    def register_cast_kind(cls, kind, caster):
+        """Register a caster for casts which are instances of `kind`.
+
+        This is how ``[int]``, ``(int,)`` and ``{'value': int}`` casts are
+        handled, see :meth:`register_cast`.  Subclasses of `kind` are
+        matched as well, and a caster registered for the type of a cast
+        takes precedence over one registered for the cast itself.
+
+        :param kind: The type of the cast.
+        :param caster: A callable with the signature
+            ``caster(cls, value, cast)``.
+        """
+        cls._OWN_CAST_KINDS[kind] = caster
+        cls._update_casters()
+
+    @classmethod
+    def _update_casters(cls):
+        # Merge the casters registered along the MRO, subclasses first, and
+        # propagate them to the subclasses
+        casters, kinds = {}, {}
+        for klass in reversed(cls.__mro__):
+            casters.update(vars(klass).get('_OWN_CASTERS', {}))
+            kinds.update(vars(klass).get('_OWN_CAST_KINDS', {}))
+        cls._CASTERS, cls._CAST_KINDS = casters, kinds
+        cls._cast_kind_cache = {}
+        cls._dict_cast_cache = {}
+        for subclass in cls.__subclasses__():
+            subclass._update_casters()
+
+    def cache_info(self):
+        """Report statistics of the value cache.
+
+        :rtype: CacheInfo
+        """
+        return CacheInfo(
+            self._cache_hits,
+            self._cache_misses,
+            len(self._value_cache or ()),
+        )
+
+    def cache_clear(self):
+        """Clear the value cache and its statistics."""
+        if self._value_cache is not None:
+            self._value_cache.clear()
+        self._cache_hits = self._cache_misses = 0
+
+    def enable_stats(self, max_call_sites=5):
+        """Record statistics of every variable lookup, see :meth:`stats`.
+
+        Lookups are only instrumented while enabled, a disabled instance
+        runs the very same code as one which never recorded statistics.
+
+        :param max_call_sites: The number of distinct call sites recorded
+            per variable.
+        """
+        if self._stats is None:
+            self._stats = {}
+        self._max_call_sites = max_call_sites
+        # Shadow the method for this instance only
+        self.get_value = self._get_value_with_stats
+
+    def disable_stats(self):
+        """Stop recording statistics, keeping those recorded so far."""
+        vars(self).pop('get_value', None)
+
+    def stats(self):
+        """Report statistics of the variables looked up while enabled.
+
+        :returns: Dictionary mapping variable names to :class:`AccessStats`
+            holding the number of lookups, the time spent resolving and
+            casting in seconds, and the first distinct call sites as
+            ``(filename, lineno, function)`` tuples.
+        """
+        return {
+            var: AccessStats(
+                record.accesses, record.cast_time, list(record.call_sites))
+            for var, record in (self._stats or {}).items()
+        }
+
+    def stats_clear(self):
+        """Clear the recorded statistics."""
+        if self._stats is not None:
+            self._stats.clear()
+
+    def _get_value_with_stats(self, var, cast=None, default=NOTSET,
+                              parse_default=False):
+        start = time.perf_counter()
+        try:
+            return type(self).get_value(
+                self, var, cast=cast, default=default,
+                parse_default=parse_default)
+        finally:
+            elapsed = time.perf_counter() - start
+            record = self._stats.get(var)
+            if record is None:
+                record = self._stats.setdefault(var, _AccessRecord())
+            record.accesses += 1
+            record.cast_time += elapsed
+
+            call_sites = record.call_sites
+            if len(call_sites) < self._max_call_sites:
+                call_site = _call_site()
+                if call_site not in call_sites:
+                    call_sites.append(call_site)
+
+    def resolve(self):
+        """Resolve every variable declared in the scheme.
+
+        :returns: Dictionary mapping variable names to their values.
+        :raises ImproperlyConfigured: listing every variable which is
+            missing or could not be casted.
+        """
+        return self.resolve_many(self.scheme)
+
+    def resolve_many(self, schema):
+        """Resolve all variables of the given schema in one pass.
+
+        Unlike separate lookups, resolution does not stop at the first
+        failure; all missing or malformed variables are reported at once.
+
+        Usage:::
+
+            settings = env.resolve_many({
+                'DEBUG': (bool, False),
+                'WORKERS': int,
+                'ALLOWED_HOSTS': ([str], []),
+            })
+
+        :param schema: Mapping of variable names to a cast or a
+            ``(cast, default)`` pair, in the same format as the scheme
+            passed to :class:`Env`.
+        :returns: Dictionary mapping variable names to their values.
+        :raises ImproperlyConfigured: listing every variable which is
+            missing or could not be casted.
+        """
+        values, errors = {}, []
+        for var, var_info in schema.items():
+            if schema is self.scheme:
+                cast, default = None, self.NOTSET
+            else:
+                plan = self._compile_scheme_entry(var_info)
+                cast, default = plan.cast, plan.default
+
+            try:
+                values[var] = self.get_value(var, cast=cast, default=default)
+            except compat.ImproperlyConfigured as exc:
+                errors.append(str(exc))
+            except Exception as exc:  # pylint: disable=broad-except
+                # Casts raise anything, e.g. IndexError for a dict item
+                # without "="
+                errors.append('Invalid value of the {} environment variable: '
+                              '{}'.format(var, exc))
+
+        if errors:
+            raise compat.ImproperlyConfigured(
+                'Unable to resolve {} environment variable(s):\n{}'.format(
+                    len(errors), '\n'.join('  ' + err for err in errors)))
+
+        return values
+
+    @classmethod
+    def enable_url_config_cache(cls, maxsize=128):
+        """Memoize the results of the ``*_url_config`` methods.
+
+        :meth:`db_url_config`, :meth:`cache_url_config`,
+        :meth:`email_url_config` and :meth:`search_url_config` share a
+        least-recently-used cache holding up to `maxsize` configs.  Each call
+        returns a copy of the cached config, which callers are free to
+        modify.  Calling this again clears the cache.
+
+        :param maxsize: The maximum number of cached configs.
+        """
+        global _url_config_cache  # pylint: disable=global-statement
+        _url_config_cache = functools.lru_cache(maxsize=maxsize)(
+            _build_url_config)
+
+    @classmethod
+    def disable_url_config_cache(cls):
+        """Stop memoizing the ``*_url_config`` methods and drop the cache."""
+        global _url_config_cache  # pylint: disable=global-statement
+        _url_config_cache = None
+
+    @classmethod
+    def url_config_cache_info(cls):
+        """Report statistics of the URL config cache.
+
+        :rtype: CacheInfo
+        """
+        if _url_config_cache is None:
+            return CacheInfo(0, 0, 0)
+        info = _url_config_cache.cache_info()
+        return CacheInfo(info.hits, info.misses, info.currsize)
+
+    @classmethod
+    def snapshot(cls):
+        """Return an immutable snapshot of ENVIRON.
+
+        Bind an instance to it to resolve variables without touching
+        ``os.environ``::
+
+            env.read_env('.env')
+            env.ENVIRON = env.snapshot()
+
+        :rtype: EnvironSnapshot
+        """
+        return EnvironSnapshot(cls.ENVIRON)
+
     # Shortcuts
 
     def str(self, var, default=NOTSET, multiline=False):
@@ -244,6 +1610,56 @@ class Env:
             default=default
         )
 
+    def iter_list(self, var, cast=None, default=NOTSET):
+        """Iterate over the items of a comma-separated list.
+
+        Items are split off in small chunks and cast one at a time, without
+        building the whole list first.
+
+        :rtype: iterator
+        """
+        value = self.get_value(var, cast=str, default=default)
+        if not isinstance(value, str):
+            # A default, possibly of the scheme, which is not a string
+            return iter(value or ())
+
+        items = _iter_list_items(value)
+        return items if cast is None else map(cast, items)
+
+    def array(self, var, typecode='l', default=NOTSET, numpy=False):
+        """Parse a comma-separated list of numbers into a compact array.
+
+        :param typecode: An :mod:`array` typecode of an integer or floating
+            point type, e.g. ``'l'`` or ``'d'``.
+        :param numpy: Return a NumPy array with the dtype of `typecode`
+            instead of an :class:`array.array`.  Requires NumPy.
+        :rtype: array.array
+        """
+        if typecode in _ARRAY_INT_TYPECODES:
+            cast = int
+        elif typecode in _ARRAY_FLOAT_TYPECODES:
+            cast = float
+        else:
+            raise ValueError(
+                'Unsupported array typecode: {!r}'.format(typecode))
+
+        value = self.get_value(var, cast=str, default=default)
+        if not isinstance(value, str):
+            # A default, possibly of the scheme, which is not a string
+            return value
+
+        if numpy:
+            import numpy as np
+            return np.fromiter(
+                map(cast, _iter_list_items(value)), dtype=typecode)
+
+        import array
+
+        result = array.array(typecode)
+        for chunk in _iter_list_chunks(value):
+            result.fromlist(list(map(cast, filter(None, chunk))))
+        return result
+
     def tuple(self, var, cast=None, default=NOTSET):
         """
         :rtype: tuple
@@ -254,18 +1670,27 @@ class Env:
             default=default
         )
 
-    def dict(self, var, cast=dict, default=NOTSET):
+    def dict(self, var, cast=dict, default=NOTSET, lazy=False):
         """
+        :param lazy: Return a :class:`LazyMapping` casting each value on
+            first access instead of a dict.
         :rtype: dict
         """
-        return self.get_value(var, cast=cast, default=default)
+        if not lazy:
+            return self.get_value(var, cast=cast, default=default)
+
+        value = self.get_value(var, cast=str, default=default)
+        if not isinstance(value, str):
+            # A default, possibly of the scheme, which is not a string
+            return value
+        return LazyMapping(value, cast, type(self))
 
     def url(self, var, default=NOTSET):
         """
         :rtype: urlparse.ParseResult
         """
         return self.get_value(
-            var, cast=urlparse,
+            var, cast=_urlparse,
             default=default,
             parse_default=True
         )
@@ -335,44 +1760,85 @@ class Env:
 
         :returns: Value from environment or default (if set)
         """
-        logger.debug("get '%s' casted as '%s' with default '%s'",
-                     var, cast, default)
+        if self._value_cache is not None:
+            return self._get_cached_value(var, cast, default, parse_default)
+        return self._get_value(var, cast, default, parse_default)
 
-        if var in self.scheme:
-            var_info = self.scheme[var]
+    def _get_cached_value(self, var, cast, default, parse_default):
+        """Return value for given variable using the value cache.
 
+        Every entry remembers the raw value it was cast from and is only
+        reused while ENVIRON still holds that very value, so any change to
+        the environment, including ``read_env``, invalidates it.  Changes
+        of the scheme entry of the variable invalidate it as well.
+        """
+        key = (var, cast, type(default), default, parse_default)
+        try:
+            entry = self._value_cache.get(key)
+        except TypeError:
+            # Unhashable cast or default, e.g. [int] or a list
             try:
-                has_default = len(var_info) == 2
+                key = (_FROZEN, var, _freeze(cast), type(default),
+                       _freeze(default), parse_default)
             except TypeError:
-                has_default = False
+                return self._get_value(var, cast, default, parse_default)
+            entry = self._value_cache.get(key)
+
+        raw = self.ENVIRON.get(var, _MISSING)
+        if raw is _MISSING and self.secret_files:
+            raw = self._get_secret_file_value(var)
+        scheme_entry = self.scheme.get(var, _MISSING)
+        if entry is not None and entry[0] == raw and \
+                entry[1] is scheme_entry:
+            self._cache_hits += 1
+            return _copy_result(entry[2])
+
+        self._cache_misses += 1
+        value = self._get_value(var, cast, default, parse_default)
+
+        # Proxied values depend on other variables, do not keep them
+        proxied = raw if raw is not _MISSING else default
+        if not (self.interpolate and isinstance(proxied, str) and
+                (proxied.startswith('$') or '${' in proxied)):
+            self._value_cache[key] = (raw, scheme_entry, value)
+            value = _copy_result(value)
 
-            if has_default:
-                if not cast:
-                    cast = var_info[0]
+        return value
 
-                if default is self.NOTSET:
-                    try:
-                        default = var_info[1]
-                    except IndexError:
-                        pass
-            else:
-                if not cast:
-                    cast = var_info
+    def _get_value(self, var, cast, default, parse_default):
+        logger.debug("get '%s' casted as '%s' with default '%s'",
+                     var, cast, default)
+
+        caster = None
+        plan = self._get_plan(var)
+        if plan is not None:
+            if not cast:
+                cast, caster = plan.cast, plan.caster
+
+            if default is self.NOTSET:
+                default = plan.default
 
         try:
             value = self.ENVIRON[var]
         except KeyError as exc:
-            if default is self.NOTSET:
-                error_msg = "Set the {} environment variable".format(var)
-                raise ImproperlyConfigured(error_msg) from exc
+            value = _MISSING
+            if self.secret_files:
+                value = self._get_secret_file_value(var)
 
-            value = default
+            if value is _MISSING:
+                if default is self.NOTSET:
+                    error_msg = "Set the {} environment variable".format(var)
+                    raise compat.ImproperlyConfigured(error_msg) from exc
+
+                value = default
 
-        # Resolve any proxied values
-        if self.interpolate and hasattr(value, 'startswith') and \
-                value.startswith('$'):
-            value = value.lstrip('$')
-            value = self.get_value(value, cast=cast, default=default)
+        # Resolve any proxied values and ${VAR} references
+        if self.interpolate and isinstance(value, str) and '$' in value:
+            if '${' in value:
+                value = self._interpolate_value(var, value)
+            elif value.startswith('$'):
+                value = self._get_proxied_value(
+                    var, value.lstrip('$'), cast, default)
 
         # Smart casting
         if self.smart_cast:
@@ -381,10 +1847,115 @@ class Env:
                 cast = type(default)
 
         if value != default or (parse_default and value):
-            value = self.parse_value(value, cast)
+            if caster is not None:
+                value = caster(value)
+            else:
+                value = self.parse_value(value, cast)
 
         return value
 
+    def _get_plan(self, var):
+        """Return the plan of `var`, compiling scheme changes first."""
+        entry = self.scheme.get(var, _MISSING)
+        if entry is _MISSING:
+            return None
+
+        plan = self._plans.get(var)
+        if plan is None or plan.entry is not entry:
+            # The scheme was changed in place after compile()
+            plan = self._plans[var] = self._compile_scheme_entry(entry)
+        return plan
+
+    def _get_secret_file_value(self, var):
+        """Read the value of `var` from the file named by ``<VAR>_FILE``."""
+        file_var = var + self.FILE_SUFFIX
+        path = self.ENVIRON.get(file_var)
+        if path is None:
+            return _MISSING
+
+        try:
+            return _read_secret_file(path)
+        except (OSError, UnicodeDecodeError) as exc:
+            raise compat.ImproperlyConfigured(
+                'Unable to read {} from {}, set by the {} environment '
+                'variable: {}'.format(var, path, file_var, exc)) from exc
+
+    def prefetch_secret_files(self, names=None, max_workers=None):
+        """Read the files referenced by ``<VAR>_FILE`` variables at once.
+
+        The files are read concurrently into the cache used by lookups of
+        ``Env(secret_files=True)``, which is useful at startup when secrets
+        are mounted from a slow or remote filesystem.  Variables which are
+        set themselves, or have no ``<VAR>_FILE`` variable, are skipped.
+
+        :param names: The names of the variables, without the suffix, to
+            read.  Defaults to the variables declared in the scheme.
+        :param max_workers: The maximum number of threads used to read the
+            files.  Defaults to one per file, bounded like
+            `ThreadPoolExecutor` does.
+        :returns: List of the variables whose files were read.
+        :raises ImproperlyConfigured: listing every file which could not be
+            read.
+        """
+        environ = self.ENVIRON
+        variables = [
+            var for var in (self.scheme if names is None else names)
+            if var not in environ and var + self.FILE_SUFFIX in environ
+        ]
+        if not variables:
+            return variables
+
+        def read(var):
+            try:
+                self._get_secret_file_value(var)
+            except compat.ImproperlyConfigured as exc:
+                return str(exc)
+            return None
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = max_workers or min(32, len(variables))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = [err for err in executor.map(read, variables) if err]
+
+        if errors:
+            raise compat.ImproperlyConfigured(
+                'Unable to read {} secret file(s):\n{}'.format(
+                    len(errors), '\n'.join('  ' + err for err in errors)))
+
+        return variables
+
+    def _interpolate_value(self, var, value):
+        """Resolve the ``${VAR}`` references of the value of `var`."""
+        environ = self.ENVIRON
+
+        def lookup(name):
+            if name == var:
+                return value
+            return environ.get(name, _MISSING)
+
+        return _interpolate([var], lookup)[var]
+
+    def _get_proxied_value(self, var, target, cast, default):
+        """Look up the variable a ``$VAR`` value proxies."""
+        chain = getattr(_proxy_chains, 'chain', None)
+        if chain is None:
+            chain = _proxy_chains.chain = []
+        if (self, target) in chain or target == var:
+            cycle = [
+                name for env, name in
+                chain[chain.index((self, target)):]
+            ] if (self, target) in chain else []
+            raise compat.ImproperlyConfigured(
+                'Circular reference in environment variables: {}'.format(
+                    ' -> '.join(cycle + [var, target])))
+
+        chain.append((self, var))
+        try:
+            return self.get_value(target, cast=cast, default=default)
+        finally:
+            chain.pop()
+
     # Class and static methods
 
     @classmethod
@@ -398,54 +1969,22 @@ class Env:
         """
         if cast is None:
             return value
-
-        if cast is bool:
+        # Same as _find_caster(), inlined as this is called for every value
+        try:
+            caster = cls._cast_kind_cache[type(cast)]
+        except KeyError:
+            caster = cls._cache_cast_kind(type(cast))
+        if caster is None:
             try:
-                value = int(value) != 0
-            except ValueError:
-                value = value.lower() in cls.BOOLEAN_TRUE_STRINGS
-        elif isinstance(cast, list):
-            value = list(map(cast[0], [x for x in value.split(',') if x]))
-        elif isinstance(cast, tuple):
-            val = value.strip('(').strip(')').split(',')
-            value = tuple(map(cast[0], [x for x in val if x]))
-        elif isinstance(cast, dict):
-            key_cast = cast.get('key', str)
-            value_cast = cast.get('value', str)
-            value_cast_by_key = cast.get('cast', {})
-            value = dict(map(
-                lambda kv: (
-                    key_cast(kv[0]),
-                    cls.parse_value(
-                        kv[1],
-                        value_cast_by_key.get(kv[0], value_cast)
-                    )
-                ),
-                [val.split('=') for val in value.split(';') if val]
-            ))
-        elif cast is dict:
-            value = dict([val.split('=') for val in value.split(',') if val])
-        elif cast is list:
-            value = [x for x in value.split(',') if x]
-        elif cast is tuple:
-            val = value.strip('(').strip(')').split(',')
-            value = tuple([x for x in val if x])
-        elif cast is float:
-            # clean string
-            float_str = re.sub(r'[^\d,.-]', '', value)
-            # split for avoid thousand separator and different locale
-            # comma/dot symbol
-            parts = re.split(r'[,.]', float_str)
-            if len(parts) == 1:
-                float_str = parts[0]
-            else:
-                float_str = "{}.{}".format(''.join(parts[0:-1]), parts[-1])
-            value = float(float_str)
-        else:
-            value = cast(value)
-        return value
+                caster = cls._CASTERS.get(cast)
+            except TypeError:
+                pass
+            if caster is None:
+                return cast(value)
+        return caster(cls, value, cast)
 
     @classmethod
+    @_memoize_url_config
     def db_url_config(cls, url, engine=None):
         """Pulled from DJ-Database-URL, parse an arbitrary Database URL.
 
@@ -467,7 +2006,9 @@ class Env:
                     'NAME': ':memory:'
                 }
                 # note: no other settings are required for sqlite
-            url = urlparse(url)
+            url = _parse_dsn(url)
+        else:
+            url = _dsn_from_parse_result(url)
 
         config = {}
 
@@ -484,7 +2025,7 @@ class Env:
             if url.netloc:
                 warn_msg = ('SQLite URL contains host component %r, '
                             'it will be ignored')
-                warnings.warn(warn_msg % url.netloc, stacklevel=3)
+                warnings.warn(warn_msg % url.netloc, stacklevel=5)
         if url.scheme == 'ldap':
             path = '{scheme}://{hostname}'.format(
                 scheme=url.scheme,
@@ -518,11 +2059,11 @@ class Env:
 
         if url.query:
             config_options = {}
-            for key, val in parse_qs(url.query).items():
+            for key, val in _parse_query(url.query).items():
                 if key.upper() in cls._DB_BASE_OPTIONS:
-                    config.update({key.upper(): _cast(val[0])})
+                    config.update({key.upper(): _cast(val)})
                 else:
-                    config_options.update({key: _cast_int(val[0])})
+                    config_options.update({key: _cast_int(val)})
             config['OPTIONS'] = config_options
 
         if engine:
@@ -540,6 +2081,7 @@ class Env:
         return config
 
     @classmethod
+    @_memoize_url_config
     def cache_url_config(cls, url, backend=None):
         """Pulled from DJ-Cache-URL, parse an arbitrary Cache URL.
 
@@ -550,12 +2092,11 @@ class Env:
         if not isinstance(url, cls.URL_CLASS):
             if not url:
                 return {}
-            url = urlparse(url)
+            url = _urlparse(url)
 
         if url.scheme not in cls.CACHE_SCHEMES:
-            raise ImproperlyConfigured('Invalid cache schema {}'.format(
-                url.scheme
-            ))
+            raise compat.ImproperlyConfigured(
+                'Invalid cache schema {}'.format(url.scheme))
 
         location = url.netloc.split(',')
         if len(location) == 1:
@@ -605,12 +2146,13 @@ class Env:
         return config
 
     @classmethod
+    @_memoize_url_config
     def email_url_config(cls, url, backend=None):
         """Parses an email URL."""
 
         config = {}
 
-        url = urlparse(url) if not isinstance(url, cls.URL_CLASS) else url
+        url = _urlparse(url) if not isinstance(url, cls.URL_CLASS) else url
 
         # Remove query strings
         path = url.path[1:]
@@ -628,7 +2170,8 @@ class Env:
         if backend:
             config['EMAIL_BACKEND'] = backend
         elif url.scheme not in cls.EMAIL_SCHEMES:
-            raise ImproperlyConfigured('Invalid email schema %s' % url.scheme)
+            raise compat.ImproperlyConfigured(
+                'Invalid email schema %s' % url.scheme)
         elif url.scheme in cls.EMAIL_SCHEMES:
             config['EMAIL_BACKEND'] = cls.EMAIL_SCHEMES[url.scheme]
 
@@ -650,17 +2193,19 @@ class Env:
         return config
 
     @classmethod
+    @_memoize_url_config
     def search_url_config(cls, url, engine=None):
         config = {}
 
-        url = urlparse(url) if not isinstance(url, cls.URL_CLASS) else url
+        url = _urlparse(url) if not isinstance(url, cls.URL_CLASS) else url
 
         # Remove query strings.
         path = url.path[1:]
         path = unquote_plus(path.split('?', 2)[0])
 
         if url.scheme not in cls.SEARCH_SCHEMES:
-            raise ImproperlyConfigured('Invalid search schema %s' % url.scheme)
+            raise compat.ImproperlyConfigured(
+                'Invalid search schema %s' % url.scheme)
         config["ENGINE"] = cls.SEARCH_SCHEMES[url.scheme]
 
         # check commons params
@@ -738,7 +2283,9 @@ class Env:
         return config
 
     @classmethod
-    def read_env(cls, env_file=None, overwrite=False, encoding=None, **kwargs):
+    def read_env(cls, env_file=None, overwrite=False, encoding=None,
+                 stream=False, memory_map=False, parse_cache=None,
+                 interpolate=False, **kwargs):
         """Read a .env file into ENVIRON.
 
         By default, existing environment variables take precedent and are not
@@ -757,6 +2304,28 @@ class Env:
         :param encoding: The name of the encoding used to read and decode the
             file. If is not specified the encoding used is platform
             dependent.
+        :param stream: Whether to read the file line by line and apply each
+            variable as soon as it is parsed, instead of reading the whole
+            file at once.  Memory use is then bounded by the longest line,
+            which suits very large files and pipes.  Lines of binary file
+            objects, e.g. a process's stdout, are decoded using `encoding`.
+            Defaults to `False`.
+        :param memory_map: Whether to map the file into memory and parse it
+            directly from the mapping, so that the operating system shares
+            its pages between processes reading the same file.  Requires an
+            ASCII-compatible `encoding` and a regular file, either a path or
+            a file object opened in binary mode.  Defaults to `False`.
+        :param parse_cache: Cache the parsed variables of `env_file`, which
+            must be a path, to skip parsing it again while it is unchanged.
+            Either the directory to store the cache file in, or `True` to
+            store it next to `env_file`.  The cache is invalidated when the
+            modification time, size or content hash of the file changes.
+            Defaults to `None`, no caching.
+        :param interpolate: Whether to resolve ``${VAR}`` and
+            ``${VAR:-default}`` references in the values before setting
+            them.  References see the values the variables have once the
+            file is applied.  Reading the whole file first, this disables
+            the memory bound of `stream`.  Defaults to `False`.
         :param **kwargs: Any additional keyword arguments provided directly
             to read_env will be added to the environment.  If the key matches
             an existing environment variable, the value will be overridden.
@@ -773,40 +2342,126 @@ class Env:
                 )
                 return
 
+        setenv = _make_setenv(cls.ENVIRON, overwrite=overwrite)
+
         try:
-            if isinstance(env_file, (str, Path, PosixPath, WindowsPath)):
-                with open(env_file.__str__(), encoding=encoding) as file:
-                    content = file.read()
+            is_path = isinstance(env_file,
+                                 (str, Path, PosixPath, WindowsPath))
+            if is_path:
+                if memory_map or parse_cache:
+                    file = open(env_file.__str__(), 'rb')
+                else:
+                    file = open(env_file.__str__(), encoding=encoding)
             else:
-                with env_file as file:
-                    content = file.read()
+                file = env_file
+
+            with file:
+                if is_path and parse_cache:
+                    pairs = _read_env_pairs_cached(
+                        file,
+                        _parse_cache_path(env_file.__str__(), parse_cache),
+                        encoding
+                    )
+                else:
+                    if memory_map:
+                        lines = _iter_env_mapped_lines(file, encoding)
+                    elif stream:
+                        lines = _iter_env_file_lines(file, encoding)
+                    else:
+                        lines = file.read().splitlines()
+                    pairs = _parse_env_lines(lines)
+
+                if interpolate:
+                    pairs = _interpolate_pairs(
+                        pairs, cls.ENVIRON, overwrite, kwargs)
+
+                logger.debug('Read environment variables from: %s', env_file)
+                for key, val in pairs:
+                    setenv(key, val)
         except OSError:
             warnings.warn(
                 "Error reading %s - if you're not configuring your "
                 "environment separately, check this." % env_file)
             return
 
-        logger.debug('Read environment variables from: %s', env_file)
-        setenv = _make_setenv(cls.ENVIRON, overwrite=overwrite)
+        # set overrides
+        for key, value in kwargs.items():
+            cls.ENVIRON[key] = value
+
+    @classmethod
+    def read_env_dir(cls, path, overwrite=False, encoding=None,
+                     pattern='*.env', max_workers=None, parse_cache=None,
+                     interpolate=False, **kwargs):
+        """Read a directory of layered .env files into ENVIRON.
+
+        Files matching `pattern` are parsed concurrently and then applied in
+        lexical order of their names, exactly as if `read_env` was called
+        for each of them in turn.  So by default the first file defining a
+        variable takes precedence, and with `overwrite` the last one does::
+
+            env.d/00-base.env
+            env.d/10-region.env
+            env.d/20-secrets.env
 
-        def _keep_escaped_format_characters(match):
-            """Keep escaped newline/tabs in quoted strings."""
-            escaped_char = match.group(1)
-            if escaped_char in 'rnt':
-                return '\\' + escaped_char
-            return escaped_char
-
-        for line in content.splitlines():
-            match1 = re.match(r'\A(?:export )?([A-Za-z_0-9]+)=(.*)\Z', line)
-            if match1:
-                key, val = match1.group(1), match1.group(2)
-                match2 = re.match(r"\A'(.*)'\Z", val)
-                if match2:
-                    val = match2.group(1)
-                match3 = re.match(r'\A"(.*)"\Z', val)
-                if match3:
-                    val = re.sub(r'\\(.)', _keep_escaped_format_characters,
-                                 match3.group(1))
+        :param path: The path to the directory holding the `.env` files.
+        :param overwrite: Whether to override the system environment variables
+            and those of previous files.  Defaults to `False`.
+        :param encoding: The name of the encoding used to decode the files.
+        :param pattern: Shell-style pattern of the file names to read.
+            Defaults to ``*.env``.
+        :param max_workers: The maximum number of threads used to read the
+            files.  Defaults to one per file, bounded like
+            `ThreadPoolExecutor` does.
+        :param parse_cache: Cache parsed files, see `read_env`.
+        :param interpolate: Resolve ``${VAR}`` references, see `read_env`.
+            References see the values the variables have once all files
+            are applied.
+        :param **kwargs: Any additional keyword arguments are added to the
+            environment after all files are applied.
+        """
+        try:
+            import fnmatch
+
+            with os.scandir(str(path)) as entries:
+                files = sorted(
+                    entry.path for entry in entries
+                    if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()
+                )
+        except OSError:
+            warnings.warn(
+                "Error reading %s - if you're not configuring your "
+                "environment separately, check this." % path)
+            return
+
+        def read(file_path):
+            try:
+                return _read_env_file_pairs(file_path, encoding, parse_cache)
+            except OSError:
+                warnings.warn(
+                    "Error reading %s - if you're not configuring your "
+                    "environment separately, check this." % file_path)
+                return []
+
+        if files:
+            from concurrent.futures import ThreadPoolExecutor
+
+            workers = max_workers or min(32, len(files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(read, files))
+        else:
+            parsed = []
+
+        if interpolate:
+            resolved = iter(_interpolate_pairs(
+                (pair for pairs in parsed for pair in pairs),
+                cls.ENVIRON, overwrite, kwargs
+            ))
+            parsed = [[next(resolved) for _ in pairs] for pairs in parsed]
+
+        setenv = _make_setenv(cls.ENVIRON, overwrite=overwrite)
+        for file_path, pairs in zip(files, parsed):
+            logger.debug('Read environment variables from: %s', file_path)
+            for key, val in pairs:
                 setenv(key, val)
 
         # set overrides
@@ -919,24 +2574,29 @@ class Path:
     def _absolute_join(base, *paths, **kwargs):
         absolute_path = os.path.abspath(os.path.join(base, *paths))
         if kwargs.get('required', False) and not os.path.exists(absolute_path):
-            raise ImproperlyConfigured(
+            raise compat.ImproperlyConfigured(
                 "Create required path: {}".format(absolute_path))
         return absolute_path
 
 
 def register_scheme(scheme):
-    for method in dir(urlparselib):
-        if method.startswith('uses_'):
-            getattr(urlparselib, method).append(scheme)
+    """Register a URL scheme parsed like a hierarchical one.
+
+    This affects the URLs parsed by :class:`Env` only, the lists of
+    ``urllib.parse`` are left untouched.
+    """
+    _URL_SCHEMES.add(scheme)
 
 
 def register_schemes(schemes):
-    for scheme in schemes:
-        register_scheme(scheme)
+    """Register several URL schemes, see :func:`register_scheme`."""
+    _URL_SCHEMES.update(schemes)
 
 
-# Register database and cache schemes in URLs.
-register_schemes(Env.DB_SCHEMES.keys())
-register_schemes(Env.CACHE_SCHEMES.keys())
+# Database, cache, search and email schemes known to Env. Look the schemes
+# up in the class dict, to not resolve them at import.
+_URL_SCHEMES = set()
+register_schemes(vars(Env)['DB_SCHEMES'].keys())
+register_schemes(vars(Env)['CACHE_SCHEMES'].keys())
 register_schemes(Env.SEARCH_SCHEMES.keys())
 register_schemes(Env.EMAIL_SCHEMES.keys())
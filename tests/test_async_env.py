@@ -0,0 +1,202 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import asyncio
+
+import pytest
+
+import environ
+from environ import (
+    AsyncEnv,
+    AsyncSource,
+    Env,
+    EnvironSource,
+    FileSource,
+    environ as environ_module,
+)
+from environ.compat import ImproperlyConfigured
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class DictSource(AsyncSource):
+    """A slow key-value store counting its round trips."""
+
+    def __init__(self, values, delay=0.0, timeout=None):
+        super().__init__(timeout=timeout)
+        self.values, self.delay, self.calls = values, delay, []
+
+    async def get(self, var):
+        await asyncio.sleep(self.delay)
+        return self.values.get(var)
+
+    async def get_many(self, names):
+        self.calls.append(sorted(names))
+        return await super().get_many(names)
+
+
+@pytest.fixture(autouse=True)
+def environ_vars(monkeypatch):
+    monkeypatch.setattr(environ_module, '_secret_files', {})
+    values = {
+        'DEBUG': 'on',
+        'WORKERS': '4',
+        'HOSTS': 'a.example.com,b.example.com',
+        'DATABASE_URL': 'postgres://user:pass@db:5432/app',
+        'CACHE_URL': 'rediscache://cache:6379/1',
+    }
+    monkeypatch.setattr(Env, 'ENVIRON', values)
+    return values
+
+
+@pytest.fixture
+def secrets(tmp_path):
+    (tmp_path / 'DB_PASSWORD').write_text('hunter2\n')
+    (tmp_path / 'WORKERS').write_text('8')
+    return tmp_path
+
+
+def test_lazy_import():
+    assert environ.AsyncEnv is AsyncEnv
+    with pytest.raises(AttributeError):
+        environ.AsyncNothing  # pylint: disable=pointless-statement
+
+
+def test_accessors():
+    env = AsyncEnv(DEBUG=(bool, False))
+    assert run(env('DEBUG')) is True
+    assert run(env.int('WORKERS')) == 4
+    assert run(env.list('HOSTS')) == ['a.example.com', 'b.example.com']
+    assert run(env.str('MISSING', default='x')) == 'x'
+    assert run(env.db())['HOST'] == 'db'
+    assert run(env.cache())['LOCATION'] == 'redis://cache:6379/1'
+
+    with pytest.raises(ImproperlyConfigured):
+        run(env.str('MISSING'))
+
+
+def test_source_precedence(secrets):
+    store = DictSource({'WORKERS': '16', 'REGION': 'eu'})
+    env = AsyncEnv(FileSource(secrets), EnvironSource(), store)
+    assert run(env.int('WORKERS')) == 8
+    assert run(env.str('DB_PASSWORD')) == 'hunter2'
+    assert run(env.str('REGION')) == 'eu'
+    assert run(env.bool('DEBUG')) is True
+
+
+def test_file_source_ignores_paths(secrets):
+    source = FileSource(secrets)
+    assert run(source.get('../WORKERS')) is None
+    assert run(source.get('..')) is None
+    assert run(source.get('MISSING')) is None
+
+
+def test_resolve_many_fans_out():
+    slow = [DictSource({'A': '1'}, delay=0.2), DictSource({'B': '2'},
+                                                          delay=0.2)]
+    env = AsyncEnv(*slow)
+
+    loop = asyncio.new_event_loop()
+    try:
+        start = loop.time()
+        values = loop.run_until_complete(
+            env.resolve_many({'A': int, 'B': int, 'C': (int, 3)}))
+        elapsed = loop.time() - start
+    finally:
+        loop.close()
+
+    assert values == {'A': 1, 'B': 2, 'C': 3}
+    assert elapsed < 0.35
+    assert [source.calls for source in slow] == [[['A', 'B', 'C']]] * 2
+
+
+def test_resolve_many_errors():
+    env = AsyncEnv()
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        run(env.resolve_many({'MISSING': int, 'DEBUG': int}))
+    assert str(excinfo.value).startswith(
+        'Unable to resolve 2 environment variable(s):\n')
+
+
+def test_resolve_scheme():
+    env = AsyncEnv(DEBUG=bool, WORKERS=(int, 1), TIMEOUT=(float, 0.5))
+    assert run(env.resolve()) == {'DEBUG': True, 'WORKERS': 4, 'TIMEOUT': 0.5}
+
+
+def test_source_timeout():
+    slow = DictSource({'DEBUG': 'off'}, delay=1, timeout=0.05)
+    env = AsyncEnv(DictSource({}), slow, EnvironSource())
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        run(env.bool('DEBUG'))
+    assert str(excinfo.value) == (
+        'Timed out after 0.05s reading environment variables from '
+        '<DictSource>')
+
+
+def test_lower_precedence_source_timeout():
+    slow = DictSource({'DEBUG': 'off', 'REGION': 'eu'}, delay=1, timeout=0.5)
+    env = AsyncEnv(EnvironSource(), slow)
+
+    loop = asyncio.new_event_loop()
+    try:
+        start = loop.time()
+        assert loop.run_until_complete(env.bool('DEBUG')) is True
+        assert loop.run_until_complete(
+            env.resolve_many({'DEBUG': bool, 'WORKERS': int})) == {
+                'DEBUG': True, 'WORKERS': 4}
+        elapsed = loop.time() - start
+    finally:
+        loop.close()
+
+    # Not waiting for the slow source, which does not hold the values
+    assert elapsed < 0.25
+
+    with pytest.raises(ImproperlyConfigured):
+        run(env.str('REGION'))
+
+
+def test_lower_precedence_source_error(tmp_path):
+    (tmp_path / 'DEBUG').mkdir()
+    env = AsyncEnv(EnvironSource(), FileSource(tmp_path))
+    assert run(env.bool('DEBUG')) is True
+
+
+def test_source_error(tmp_path):
+    (tmp_path / 'WORKERS').mkdir()
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        run(AsyncEnv(FileSource(tmp_path)).int('WORKERS'))
+    assert str(excinfo.value).startswith(
+        "Unable to read environment variables from <FileSource ")
+
+
+def test_interpolation():
+    store = DictSource({
+        'URL': 'https://${HOST}:${PORT:-443}/',
+        'HOST': '${PRIMARY}',
+        'PRIMARY': 'example.com',
+    })
+    env = AsyncEnv(EnvironSource(), store, interpolate=True)
+    assert run(env.str('URL')) == 'https://example.com:443/'
+    assert run(env.str('MISSING', default='$PRIMARY')) == 'example.com'
+    assert store.calls == [['URL'], ['HOST', 'PORT'], ['PRIMARY'],
+                           ['MISSING'], ['PRIMARY']]
+
+
+def test_custom_env_class():
+    class CustomEnv(Env):
+        pass
+
+    CustomEnv.register_cast(complex, lambda cls, value, cast: cast(value))
+    env = AsyncEnv(DictSource({'Z': '1+2j'}), env_cls=CustomEnv)
+    assert run(env('Z', cast=complex)) == 1 + 2j
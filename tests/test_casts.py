@@ -0,0 +1,234 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+from collections import OrderedDict, namedtuple
+from decimal import Decimal
+
+import pytest
+
+from environ import Env
+
+
+class Seconds:
+    """A cast which is not callable."""
+
+
+def parse_seconds(cls, value, cast):
+    units = {'s': 1, 'm': 60, 'h': 3600}
+    return int(value[:-1]) * units[value[-1]]
+
+
+class Choices(frozenset):
+    pass
+
+
+def parse_choice(cls, value, cast):
+    if value not in cast:
+        raise ValueError(value)
+    return value
+
+
+@pytest.fixture
+def env_class():
+    class CustomEnv(Env):
+        pass
+
+    return CustomEnv
+
+
+def test_register_cast(env_class):
+    env_class.register_cast(Seconds, parse_seconds)
+
+    assert env_class.parse_value('2m', Seconds) == 120
+    assert 'Seconds' not in repr(Env._CASTERS)
+    with pytest.raises(TypeError):
+        Env.parse_value('2m', Seconds)
+
+
+def test_register_cast_in_scheme(env_class, monkeypatch):
+    class Celsius:
+        pass
+
+    monkeypatch.setattr(env_class, 'ENVIRON', {'T': '20', 'TIMEOUT': '2m'})
+    env_class.register_cast(Celsius, lambda cls, value, _: int(value) + 273.15)
+    env_class.register_cast(Seconds, parse_seconds)
+
+    assert env_class()('T', cast=Celsius) == 293.15
+    assert env_class(T=Celsius)('T') == 293.15
+    assert env_class(TIMEOUT=(Seconds, 0))('TIMEOUT') == 120
+
+
+def test_register_cast_overrides_builtin(env_class):
+    env_class.register_cast(float, lambda cls, value, cast: Decimal(value))
+
+    assert env_class.parse_value('0.1', float) == Decimal('0.1')
+    assert Env.parse_value('0.1', float) == 0.1
+
+
+def test_register_cast_kind(env_class, monkeypatch):
+    monkeypatch.setattr(env_class, 'ENVIRON', {'MODE': 'fast'})
+    env_class.register_cast_kind(Choices, parse_choice)
+    modes = Choices({'fast', 'safe', 'auto'})
+
+    env = env_class(MODE=modes)
+    assert env('MODE') == 'fast'
+    assert env_class.parse_value('safe', modes) == 'safe'
+    with pytest.raises(ValueError):
+        env_class.parse_value('slow', modes)
+
+
+def test_register_on_base_after_subclass(env_class):
+    class ChildEnv(env_class):
+        pass
+
+    ChildEnv.register_cast_kind(
+        frozenset, lambda cls, value, cast: set(value))
+    ChildEnv.register_cast(float, lambda cls, value, cast: Decimal(value))
+    modes = Choices({'fast', 'safe', 'auto'})
+    assert ChildEnv.parse_value('fast', modes) == {'f', 'a', 's', 't'}
+
+    env_class.register_cast_kind(Choices, parse_choice)
+    env_class.register_cast(Seconds, parse_seconds)
+
+    assert ChildEnv.parse_value('fast', modes) == 'fast'
+    assert ChildEnv.parse_value('2m', Seconds) == 120
+    assert ChildEnv.parse_value('0.1', float) == Decimal('0.1')
+    assert env_class.parse_value('0.1', float) == 0.1
+    assert env_class.parse_value('1,2', [int]) == [1, 2]
+    with pytest.raises(TypeError):
+        Env.parse_value('fast', modes)
+
+
+def test_cast_kind_cache_per_class(env_class):
+    modes = Choices({'fast', 'safe', 'auto'})
+    with pytest.raises(TypeError):
+        Env.parse_value('fast', modes)
+
+    env_class.register_cast_kind(Choices, parse_choice)
+    assert env_class.parse_value('fast', modes) == 'fast'
+    with pytest.raises(TypeError):
+        Env.parse_value('fast', modes)
+
+
+def test_dict_cast_compiled_once(env_class):
+    spec = {'value': Seconds, 'cast': {'b': int}}
+    with pytest.raises(TypeError):
+        env_class.parse_value('a=1m;b=2', spec)
+
+    env_class.register_cast(Seconds, parse_seconds)
+    plan = env_class._dict_cast_plan(spec)
+    assert env_class._dict_cast_plan(dict(spec)) is plan
+    assert env_class.parse_value('a=1m;b=2', spec) == {'a': 60, 'b': 2}
+    assert env_class._dict_cast_plan({'value': Seconds}) is not plan
+
+
+@pytest.mark.parametrize(
+    'value,cast,expected',
+    [
+        ('1,2', namedtuple('Cast', 'item')(int), (1, 2)),
+        ('a=1;b=2', OrderedDict(value=int), {'a': 1, 'b': 2}),
+    ],
+    ids=['tuple_subclass', 'dict_subclass'],
+)
+def test_cast_kind_subclasses(value, cast, expected):
+    assert Env.parse_value(value, cast) == expected
+
+
+def test_unhashable_callable_cast():
+    class Upper:
+        __hash__ = None
+
+        def __call__(self, value):
+            return value.upper()
+
+    assert Env.parse_value('abc', Upper()) == 'ABC'
+    assert Env(VAR=Upper())._plans['VAR'].caster('abc') == 'ABC'
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('0.25', 0.25),
+        ('-1', -1.0),
+        (' 1_000.5 ', 1000.5),
+        ('1.234,56', 1234.56),
+        ('1,234.56', 1234.56),
+        ('$1.5', 1.5),
+        ('1e5', 15.0),
+        ('1E5', 15.0),
+    ],
+)
+def test_float_cast(value, expected):
+    assert Env.parse_value(value, float) == expected
+
+
+@pytest.mark.parametrize('value', ['inf', '-nan', 'Infinity', '1e-5', ''])
+def test_float_cast_invalid(value):
+    with pytest.raises(ValueError):
+        Env.parse_value(value, float)
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('true', True), ('TRUE', True), ('Yes', True), ('yEs', True),
+        ('1', True), (' 2 ', True), ('-1', True),
+        ('false', False), ('0', False), ('-0', False), ('', False),
+        ('nope', False), ('enabled', False),
+    ],
+)
+def test_bool_cast(value, expected):
+    assert Env.parse_value(value, bool) is expected
+
+
+def test_bool_cast_true_strings(env_class):
+    env_class.BOOLEAN_TRUE_STRINGS = ('enabled',)
+    assert env_class.parse_value('Enabled', bool) is True
+    assert env_class.parse_value('yes', bool) is False
+    assert Env.parse_value('yes', bool) is True
+
+    env_class.BOOLEAN_TRUE_STRINGS = ['enabled']
+    env_class.BOOLEAN_TRUE_STRINGS.append('active')
+    assert env_class.parse_value('ACTIVE', bool) is True
+
+
+@pytest.mark.parametrize(
+    'value,cast,expected',
+    [
+        ('a=1;b=2;', {'value': int}, {'a': 1, 'b': 2}),
+        ('1=a;1=b', {'key': int}, {1: 'b'}),
+        ('a=1=2', {'value': int}, {'a': 1}),
+        ('a=1;b=on;c=1,2', {'value': bool, 'cast': {'c': [int], 'b': None}},
+         {'a': True, 'b': 'on', 'c': [1, 2]}),
+    ],
+    ids=['value', 'key', 'extra_separator', 'cast_by_key'],
+)
+def test_dict_cast_plan(value, cast, expected):
+    assert Env.parse_value(value, cast) == expected
+    assert Env(VAR=cast)._plans['VAR'].caster(value) == expected
+
+
+def test_dict_cast_plan_missing_separator():
+    with pytest.raises(IndexError):
+        Env.parse_value('a=1;b', {'value': int})
+
+
+def test_parse_value_override(monkeypatch):
+    class CustomEnv(Env):
+        @classmethod
+        def parse_value(cls, value, cast):
+            return super().parse_value(value.strip(), cast)
+
+    monkeypatch.setattr(CustomEnv, 'ENVIRON', {
+        'INT': ' 42 ', 'BOOL': ' on', 'LIMITS': ' a=1;b=2 '})
+    env = CustomEnv(INT=int, BOOL=bool, LIMITS={'value': int})
+
+    assert env('INT') == 42
+    assert env.int('INT') == 42
+    assert env('BOOL') is True
+    assert env('LIMITS') == {'a': 1, 'b': 2}
@@ -0,0 +1,98 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+import environ
+from environ import compat, Env
+from environ.environ import _CompatValue, _LazySchemes
+
+
+def run_python(code):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return subprocess.check_output(
+        [sys.executable, '-c', code],
+        cwd=root,
+        universal_newlines=True,
+    ).strip()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='requires module level __getattr__')
+def test_import_does_not_resolve_compat():
+    code = (
+        'import sys, environ\n'
+        'print(sorted(name for name in ("django", "redis_cache")\n'
+        '             if name in sys.modules),\n'
+        '      "ImproperlyConfigured" in vars(environ.compat),\n'
+        '      isinstance(vars(environ.Env)["DB_SCHEMES"], dict))\n'
+    )
+    assert run_python(code) == '[] False False'
+
+
+def test_compat_names():
+    assert compat.DJANGO_POSTGRES in (
+        'django.db.backends.postgresql',
+        'django.db.backends.postgresql_psycopg2',
+    )
+    assert compat.REDIS_DRIVER in (
+        'redis_cache.RedisCache',
+        'django_redis.cache.RedisCache',
+    )
+    assert issubclass(compat.ImproperlyConfigured, Exception)
+    assert 'REDIS_DRIVER' in dir(compat)
+
+
+def test_improperly_configured_pickles():
+    error = compat.ImproperlyConfigured('Set the DEBUG environment variable')
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert type(restored) is compat.ImproperlyConfigured
+    assert restored.args == error.args
+    assert compat.ImproperlyConfigured.__name__ == 'ImproperlyConfigured'
+
+
+def test_compat_reexports():
+    assert environ.DJANGO_POSTGRES == compat.DJANGO_POSTGRES
+    assert environ.REDIS_DRIVER == compat.REDIS_DRIVER
+    assert environ.environ.ImproperlyConfigured is compat.ImproperlyConfigured
+
+    with pytest.raises(AttributeError):
+        environ.NOT_A_NAME  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError):
+        compat.NOT_A_NAME  # pylint: disable=pointless-statement
+
+
+def test_lazy_schemes():
+    assert Env.DB_SCHEMES['postgres'] == compat.DJANGO_POSTGRES
+    assert Env.CACHE_SCHEMES['redis'] == compat.REDIS_DRIVER
+
+    # Resolved once and shared by subclasses
+    assert vars(Env)['DB_SCHEMES'] is Env.DB_SCHEMES
+
+    class SubEnv(Env):
+        pass
+
+    assert SubEnv.DB_SCHEMES is Env.DB_SCHEMES
+
+
+def test_lazy_schemes_resolved_through_subclass():
+    class Base:
+        SCHEMES = _LazySchemes({'redis': _CompatValue('REDIS_DRIVER')})
+
+    class Sub(Base):
+        pass
+
+    assert Sub.SCHEMES == {'redis': compat.REDIS_DRIVER}
+    assert vars(Base)['SCHEMES'] is Sub.SCHEMES
+    assert 'SCHEMES' not in vars(Sub)
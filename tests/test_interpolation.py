@@ -0,0 +1,198 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import pytest
+
+from environ import Env
+from environ.compat import ImproperlyConfigured
+
+
+@pytest.fixture
+def environ(monkeypatch):
+    environ = {
+        'HOST': 'db.example.com',
+        'PORT': '5432',
+        'EMPTY': '',
+        'DATABASE_URL': 'postgres://${USER:-app}@${HOST}:${PORT}/${NAME}',
+        'NAME': '${USER:-app}_${STAGE:-dev}',
+        'WORKERS': '${CPUS:-4}',
+        'DIRECT': '$HOST',
+        'CYCLE_A': 'a-${CYCLE_B}',
+        'CYCLE_B': 'b-${CYCLE_C}',
+        'CYCLE_C': 'c-${CYCLE_A}',
+        'SELF': '${SELF}',
+        'PROXY_A': '$PROXY_B',
+        'PROXY_B': '$PROXY_A',
+        'BROKEN': 'x-${UNSET}',
+    }
+    monkeypatch.setattr(Env, 'ENVIRON', environ)
+    return environ
+
+
+@pytest.mark.parametrize(
+    'var,expected',
+    [
+        ('NAME', 'app_dev'),
+        ('DATABASE_URL', 'postgres://app@db.example.com:5432/app_dev'),
+        ('DIRECT', 'db.example.com'),
+    ],
+)
+def test_interpolation(environ, var, expected):
+    assert Env(interpolate=True).str(var) == expected
+
+
+def test_interpolation_disabled(environ):
+    assert Env().str('NAME') == '${USER:-app}_${STAGE:-dev}'
+
+
+def test_interpolation_cast_and_defaults(environ):
+    env = Env(interpolate=True)
+    assert env.int('WORKERS') == 4
+
+    environ['CPUS'] = ''
+    assert env.int('WORKERS') == 4
+
+    environ['CPUS'] = '8'
+    assert env.int('WORKERS') == 8
+    assert env.str('MISSING', default='${HOST}/x') == 'db.example.com/x'
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('${MEDIA_DIR:-${HOST}}/media', 'db.example.com/media'),
+        ('${MEDIA_DIR:-/srv/${USER:-${PORT}}/x}', '/srv/5432/x'),
+        ('${HOST:-${UNSET}}', 'db.example.com'),
+        ('${EMPTY:-{}}', '{}'),
+        ('a}b${HOST}', 'a}bdb.example.com'),
+        ('${MEDIA_DIR:-${HOST}', '${MEDIA_DIR:-db.example.com'),
+        ('${1A} ${', '${1A} ${'),
+    ],
+)
+def test_interpolation_nested_defaults(environ, value, expected):
+    environ['TEMPLATE'] = value
+    assert Env(interpolate=True).str('TEMPLATE') == expected
+
+
+def test_interpolation_nested_default_missing(environ):
+    environ['TEMPLATE'] = '${MEDIA_DIR:-${UNSET}/media}'
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        Env(interpolate=True).str('TEMPLATE')
+    assert str(excinfo.value) == (
+        'Set the UNSET environment variable, referenced by TEMPLATE')
+
+
+def test_interpolation_db_url(environ):
+    config = Env(interpolate=True).db()
+    assert config['HOST'] == 'db.example.com'
+    assert config['NAME'] == 'app_dev'
+
+
+@pytest.mark.parametrize(
+    'var,message',
+    [
+        ('CYCLE_A', 'CYCLE_A -> CYCLE_B -> CYCLE_C -> CYCLE_A'),
+        ('CYCLE_C', 'CYCLE_C -> CYCLE_A -> CYCLE_B -> CYCLE_C'),
+        ('SELF', 'SELF -> SELF'),
+        ('PROXY_A', 'PROXY_A -> PROXY_B -> PROXY_A'),
+    ],
+)
+def test_interpolation_cycles(environ, var, message):
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        Env(interpolate=True).str(var)
+    assert str(excinfo.value) == (
+        'Circular reference in environment variables: ' + message)
+
+
+def test_interpolation_missing_reference(environ):
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        Env(interpolate=True).str('BROKEN')
+    assert str(excinfo.value) == (
+        'Set the UNSET environment variable, referenced by BROKEN')
+
+
+def test_interpolation_cache(environ):
+    env = Env(interpolate=True, cache=True)
+    assert env.str('NAME') == 'app_dev'
+
+    environ['STAGE'] = 'prod'
+    assert env.str('NAME') == 'app_prod'
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / '.env'
+    path.write_text(
+        'BASE_DIR=/srv/${APP}\n'
+        'APP=shop\n'
+        'STATIC_ROOT=${BASE_DIR}/static\n'
+        'MEDIA_ROOT=${MEDIA_DIR:-${BASE_DIR}}/media\n'
+        'HOST=file.example.com\n'
+        'URL=https://${HOST}/\n'
+    )
+    return str(path)
+
+
+def test_read_env_interpolation(monkeypatch, env_file):
+    environ = {'HOST': 'env.example.com'}
+    monkeypatch.setattr(Env, 'ENVIRON', environ)
+
+    Env.read_env(env_file, interpolate=True, APP='blog')
+
+    assert environ['BASE_DIR'] == '/srv/blog'
+    assert environ['STATIC_ROOT'] == '/srv/blog/static'
+    assert environ['MEDIA_ROOT'] == '/srv/blog/media'
+    assert environ['HOST'] == 'env.example.com'
+    assert environ['URL'] == 'https://env.example.com/'
+    assert environ['APP'] == 'blog'
+
+
+def test_read_env_interpolation_overwrite(monkeypatch, env_file):
+    environ = {'HOST': 'env.example.com'}
+    monkeypatch.setattr(Env, 'ENVIRON', environ)
+
+    Env.read_env(env_file, overwrite=True, interpolate=True)
+
+    assert environ['BASE_DIR'] == '/srv/shop'
+    assert environ['MEDIA_ROOT'] == '/srv/shop/media'
+    assert environ['URL'] == 'https://file.example.com/'
+
+
+def test_read_env_without_interpolation(monkeypatch, env_file):
+    environ = {}
+    monkeypatch.setattr(Env, 'ENVIRON', environ)
+
+    Env.read_env(env_file)
+
+    assert environ['BASE_DIR'] == '/srv/${APP}'
+
+
+def test_read_env_interpolation_cycle(monkeypatch, tmp_path):
+    environ = {}
+    monkeypatch.setattr(Env, 'ENVIRON', environ)
+    path = tmp_path / '.env'
+    path.write_text('A=${B}\nB=${A}\n')
+
+    with pytest.raises(ImproperlyConfigured):
+        Env.read_env(str(path), interpolate=True)
+    assert environ == {}
+
+
+def test_read_env_dir_interpolation(monkeypatch, tmp_path):
+    environ = {}
+    monkeypatch.setattr(Env, 'ENVIRON', environ)
+    (tmp_path / '10-base.env').write_text('ROOT=/srv/${APP:-app}\n')
+    (tmp_path / '20-app.env').write_text('APP=shop\nLOGS=${ROOT}/logs\n')
+
+    Env.read_env_dir(str(tmp_path), interpolate=True)
+
+    assert environ == {
+        'ROOT': '/srv/shop',
+        'APP': 'shop',
+        'LOGS': '/srv/shop/logs',
+    }
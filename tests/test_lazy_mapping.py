@@ -0,0 +1,89 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+from collections.abc import Mapping
+
+import pytest
+
+from environ import Env, LazyMapping
+
+
+class CountingInt(int):
+    calls = 0
+
+    def __new__(cls, value):
+        CountingInt.calls += 1
+        return super().__new__(cls, value)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    monkeypatch.setattr(Env, 'ENVIRON', {
+        'LIMITS': 'tenant_1=10;tenant_2=20;tenant_3=30;tenant_1=40',
+        'PLAIN': 'a=1,b=2',
+        'MALFORMED': 'a=1;b',
+    })
+    CountingInt.calls = 0
+    return Env()
+
+
+def test_lazy_dict_casts_on_access(env):
+    limits = env.dict('LIMITS', cast={'value': CountingInt}, lazy=True)
+
+    assert isinstance(limits, LazyMapping)
+    assert isinstance(limits, Mapping)
+    assert CountingInt.calls == 0
+
+    assert limits['tenant_2'] == 20
+    assert limits['tenant_2'] == 20
+    assert limits.get('tenant_9') is None
+    assert 'tenant_3' in limits
+    assert CountingInt.calls == 1
+    assert repr(limits) == '<LazyMapping: 3 keys, 1 cast>'
+
+
+@pytest.mark.parametrize(
+    'var,cast',
+    [
+        ('LIMITS', {'value': int}),
+        ('LIMITS', {'value': float, 'cast': {'tenant_3': str}}),
+        ('PLAIN', dict),
+    ],
+)
+def test_lazy_dict_matches_dict(env, var, cast):
+    expected = env.dict(var, cast=cast)
+    lazy = env.dict(var, cast=cast, lazy=True)
+
+    assert lazy == expected
+    assert list(lazy) == list(expected)
+    assert dict(lazy.items()) == expected
+    assert len(lazy) == len(expected)
+
+
+def test_lazy_dict_default(env):
+    default = {'tenant_1': 1}
+    assert env.dict('MISSING', cast={'value': int}, default=default,
+                    lazy=True) is default
+
+    lazy = env.dict('MISSING', cast={'value': int}, default='a=1', lazy=True)
+    assert dict(lazy) == {'a': 1}
+
+
+def test_lazy_dict_scheme_default(env):
+    default = {'a': '1'}
+    scheme_env = Env(D=(dict, default))
+    assert scheme_env.dict('D', lazy=True) is default
+
+
+def test_lazy_dict_errors(env):
+    with pytest.raises(IndexError):
+        env.dict('MALFORMED', cast={'value': int}, lazy=True)
+    with pytest.raises(TypeError):
+        env.dict('PLAIN', cast=list, lazy=True)
+    with pytest.raises(KeyError):
+        env.dict('PLAIN', lazy=True)['c']
@@ -0,0 +1,112 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import array
+from collections.abc import Iterator
+
+import pytest
+
+from environ import Env
+from environ.environ import _iter_list_chunks
+
+
+@pytest.fixture
+def env(monkeypatch):
+    monkeypatch.setattr(Env, 'ENVIRON', {
+        'IDS': '1,2,,3, 4,',
+        'RATIOS': '0.5,1.25,-2',
+        'NAMES': 'alpha,,beta',
+        'EMPTY': '',
+        'LARGE': '1,300',
+    })
+    return Env()
+
+
+@pytest.mark.parametrize(
+    'var,cast',
+    [('IDS', int), ('RATIOS', float), ('NAMES', None), ('EMPTY', None)],
+)
+def test_iter_list_matches_list(env, var, cast):
+    items = env.iter_list(var, cast=cast)
+
+    assert isinstance(items, Iterator)
+    assert list(items) == env.list(var, cast=cast)
+
+
+def test_iter_list_default(env):
+    assert list(env.iter_list('MISSING', default=['a'])) == ['a']
+    assert list(env.iter_list('MISSING', default=None)) == []
+    assert list(env.iter_list('MISSING', default='1,2')) == ['1', '2']
+    assert list(env.iter_list('MISSING', int, default='1,2')) == [1, 2]
+
+
+def test_iter_list_scheme_default(monkeypatch):
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    env = Env(IDS=(list, ['1', '2']), RATIOS=(list, '0.5,2'))
+
+    assert list(env.iter_list('IDS')) == ['1', '2']
+    assert list(env.iter_list('RATIOS', float)) == [0.5, 2.0]
+
+
+@pytest.mark.parametrize(
+    'var,typecode,expected',
+    [
+        ('IDS', 'l', [1, 2, 3, 4]),
+        ('IDS', 'B', [1, 2, 3, 4]),
+        ('RATIOS', 'd', [0.5, 1.25, -2.0]),
+        ('EMPTY', 'q', []),
+    ],
+)
+def test_array(env, var, typecode, expected):
+    result = env.array(var, typecode)
+
+    assert isinstance(result, array.array)
+    assert result.typecode == typecode
+    assert result.tolist() == expected
+
+
+def test_array_default(env):
+    assert env.array('MISSING', default=None) is None
+    assert env.array('MISSING', default='1,2').tolist() == [1, 2]
+
+
+def test_array_scheme_default(monkeypatch):
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    ids = array.array('l', [1, 2])
+    env = Env(IDS=(list, ids), RATIOS=(list, '0.5,2'))
+
+    assert env.array('IDS') is ids
+    assert env.array('RATIOS', 'd').tolist() == [0.5, 2.0]
+
+
+@pytest.mark.parametrize('typecode', ['u', 'x'])
+def test_array_unsupported_typecode(env, typecode):
+    with pytest.raises(ValueError):
+        env.array('IDS', typecode)
+
+
+def test_array_overflow(env):
+    with pytest.raises(OverflowError):
+        env.array('LARGE', 'B')
+
+
+def test_numpy_array(env):
+    numpy = pytest.importorskip('numpy')
+
+    result = env.array('IDS', 'l', numpy=True)
+    assert isinstance(result, numpy.ndarray)
+    assert result.dtype == numpy.dtype('l')
+    assert result.tolist() == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 4096])
+@pytest.mark.parametrize('value', ['', ',', 'a', 'a,,bc,', ',ab,c,,d'])
+def test_iter_list_chunks(value, chunk_size):
+    chunks = list(_iter_list_chunks(value, chunk_size))
+    items = [item for chunk in chunks for item in chunk if item]
+    assert items == [item for item in value.split(',') if item]
@@ -6,13 +6,17 @@
 # For the full copyright and license information, please view
 # the LICENSE file that was distributed with this source code.
 
+import io
 import logging
 import os
 import pathlib
+import subprocess
+import sys
 
 import pytest
 
 from environ import Env, Path
+from environ.environ import _iter_env_mapped_lines
 
 
 def test_read_env_priority(simple_env_file, monkeypatch):
@@ -121,3 +125,239 @@ def test_read_env_using_encoding(unicode_env_file):
 
     assert os.environ['SESSION_COOKIE_SECURE'] == 'True'
     assert env('SESSION_COOKIE_SECURE', cast=bool) is True
+
+
+@pytest.mark.parametrize(
+    'line,expected',
+    [
+        ('KEY=value', {'KEY': 'value'}),
+        ('export KEY=value', {'KEY': 'value'}),
+        ('KEY=', {'KEY': ''}),
+        ('KEY=a=b', {'KEY': 'a=b'}),
+        ("KEY='single quoted'", {'KEY': 'single quoted'}),
+        ('KEY="double quoted"', {'KEY': 'double quoted'}),
+        ("KEY='\"both\"'", {'KEY': 'both'}),
+        ("KEY='", {'KEY': "'"}),
+        ('KEY="', {'KEY': '"'}),
+        ('KEY="\\r\\n\\t"', {'KEY': '\\r\\n\\t'}),
+        ('KEY="\\\\n\\"\\x"', {'KEY': '\\n"x'}),
+        ("KEY='\\x'", {'KEY': '\\x'}),
+        ('KEY=\\x', {'KEY': '\\x'}),
+        ('KEY="a\\"', {'KEY': 'a\\'}),
+        ('# KEY=value', {}),
+        ('export  KEY=value', {}),
+        ('KEY = value', {}),
+        ('KEY-NAME=value', {}),
+        ('', {}),
+    ],
+)
+def test_read_env_parsing(line, expected, tmp_path, monkeypatch):
+    """Parse assignments, quoting and escapes of .env lines."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    env_file = tmp_path / '.env'
+    env_file.write_text(line + '\n')
+
+    Env.read_env(env_file)
+
+    assert Env.ENVIRON == expected
+
+
+def test_read_env_stream(env_file, monkeypatch):
+    """Streaming a file yields the same variables as reading it at once."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    Env.read_env(env_file)
+    expected = Env.ENVIRON
+
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    Env.read_env(env_file, stream=True)
+
+    assert Env.ENVIRON == expected
+
+
+def test_read_env_stream_file_objects(monkeypatch):
+    """Stream text and binary file objects."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+
+    Env.read_env(io.StringIO('FOO=foo\r\nBAR="bar"\n'), stream=True)
+    Env.read_env(io.BytesIO('BAZ=b\xe1z\r\n'.encode('utf-8')),
+                 encoding='utf-8', stream=True)
+
+    assert Env.ENVIRON == {'FOO': 'foo', 'BAR': 'bar', 'BAZ': 'b\xe1z'}
+
+
+def test_read_env_stream_pipe(monkeypatch):
+    """Stream the output of a process."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    process = subprocess.Popen(
+        [sys.executable, '-c', 'print("SECRET=top_secret")'],
+        stdout=subprocess.PIPE,
+    )
+
+    Env.read_env(process.stdout, stream=True)
+    process.wait()
+
+    assert Env.ENVIRON == {'SECRET': 'top_secret'}
+
+
+def test_read_env_memory_map(env_file, monkeypatch):
+    """A memory mapped file yields the same variables as reading it."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    Env.read_env(env_file, encoding='utf-8')
+    expected = Env.ENVIRON
+
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    Env.read_env(env_file, encoding='utf-8', memory_map=True)
+    assert Env.ENVIRON == expected
+
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    with open(env_file, 'rb') as file:
+        Env.read_env(file, encoding='utf-8', memory_map=True)
+    assert Env.ENVIRON == expected
+
+
+def test_read_env_memory_map_empty_file(tmp_path, monkeypatch):
+    """Empty files cannot be mapped, but are valid."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    env_file = tmp_path / '.env'
+    env_file.write_text('')
+
+    Env.read_env(env_file, memory_map=True)
+
+    assert Env.ENVIRON == {}
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 1 << 16])
+def test_iter_env_mapped_lines(env_file, chunk_size):
+    """Chunks of a mapped file are split on line boundaries."""
+    with open(env_file, encoding='utf-8') as file:
+        expected = file.read().splitlines()
+
+    with open(env_file, 'rb') as file:
+        lines = _iter_env_mapped_lines(file, 'utf-8', chunk_size)
+        assert list(lines) == expected
+
+
+def test_read_env_parse_cache(env_file, tmp_path, monkeypatch):
+    """Cached pairs are used while the file is unchanged."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    Env.read_env(env_file, encoding='utf-8')
+    expected = Env.ENVIRON
+
+    cache_dir = tmp_path / 'cache'
+    for _ in range(2):
+        monkeypatch.setattr(Env, 'ENVIRON', {})
+        Env.read_env(env_file, encoding='utf-8', parse_cache=cache_dir)
+        assert Env.ENVIRON == expected
+
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_read_env_parse_cache_skips_parsing(tmp_path, monkeypatch):
+    """An unchanged file is not parsed again."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    env_file = tmp_path / '.env'
+    env_file.write_text('FOO=bar\n')
+    Env.read_env(env_file, parse_cache=True)
+    assert (tmp_path / '..env.cache').exists()
+
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    monkeypatch.setattr('environ.environ._parse_env_lines', None)
+    Env.read_env(env_file, parse_cache=True)
+
+    assert Env.ENVIRON == {'FOO': 'bar'}
+
+
+def test_read_env_parse_cache_invalidation(tmp_path, monkeypatch):
+    """Any change of the file invalidates the cache."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    env_file = tmp_path / '.env'
+    env_file.write_text('FOO=bar\n')
+    stat = env_file.stat()
+    Env.read_env(env_file, overwrite=True, parse_cache=tmp_path)
+
+    # Same size and modification time, different content
+    env_file.write_text('FOO=baz\n')
+    os.utime(str(env_file), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    Env.read_env(env_file, parse_cache=tmp_path)
+    assert Env.ENVIRON == {'FOO': 'baz'}
+
+    env_file.write_text('FOO=bar\nBAR="b\\\\az"\n')
+
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    Env.read_env(env_file, parse_cache=tmp_path)
+    assert Env.ENVIRON == {'FOO': 'bar', 'BAR': 'b\\az'}
+
+
+def test_read_env_parse_cache_corrupted(tmp_path, monkeypatch):
+    """A corrupted cache file is ignored and rewritten."""
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    env_file = tmp_path / '.env'
+    env_file.write_text('FOO=bar\n')
+    Env.read_env(env_file, parse_cache=True)
+
+    cache_file = tmp_path / '..env.cache'
+    cache_file.write_bytes(cache_file.read_bytes() + b'\0')
+
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+    Env.read_env(env_file, parse_cache=True)
+
+    assert Env.ENVIRON == {'FOO': 'bar'}
+    assert not cache_file.read_bytes().endswith(b'\0')
+
+
+@pytest.fixture
+def env_dir(tmp_path):
+    """Return a directory of layered .env files."""
+    env_dir = tmp_path / 'env.d'
+    env_dir.mkdir()
+    (env_dir / '20-secrets.env').write_text('SECRET=s3cr3t\nREGION=secret\n')
+    (env_dir / '00-base.env').write_text('DEBUG=off\nREGION=base\n')
+    (env_dir / '10-region.env').write_text('REGION=eu\n')
+    (env_dir / 'README').write_text('NOT_READ=1\n')
+    (env_dir / 'sub.env').mkdir()
+    return env_dir
+
+
+def test_read_env_dir(env_dir, monkeypatch):
+    """The first file in lexical order takes precedence."""
+    monkeypatch.setattr(Env, 'ENVIRON', {'DEBUG': 'on'})
+
+    Env.read_env_dir(env_dir, SECRET='override')
+
+    assert Env.ENVIRON == {
+        'DEBUG': 'on',
+        'REGION': 'base',
+        'SECRET': 'override',
+    }
+
+
+def test_read_env_dir_overwrite(env_dir, monkeypatch):
+    """The last file in lexical order takes precedence."""
+    monkeypatch.setattr(Env, 'ENVIRON', {'DEBUG': 'on'})
+
+    Env.read_env_dir(str(env_dir), overwrite=True, max_workers=1)
+
+    assert Env.ENVIRON == {
+        'DEBUG': 'off',
+        'REGION': 'secret',
+        'SECRET': 's3cr3t',
+    }
+
+
+def test_read_env_dir_pattern(env_dir, monkeypatch):
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+
+    Env.read_env_dir(env_dir, pattern='README')
+
+    assert Env.ENVIRON == {'NOT_READ': '1'}
+
+
+def test_read_env_dir_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(Env, 'ENVIRON', {})
+
+    with pytest.warns(UserWarning, match='Error reading'):
+        Env.read_env_dir(tmp_path / 'missing')
+
+    assert Env.ENVIRON == {}
@@ -8,7 +8,11 @@
 
 import os
 
+import pytest
+
 from environ import Env
+from environ.compat import ImproperlyConfigured
+from .asserts import assert_type_and_value
 from .fixtures import FakeEnv
 
 _old_environ = None
@@ -57,3 +61,113 @@ def test_schema():
     # Override schema in this one case
     assert isinstance(env('INT_VAR', cast=str), str)
     assert env('INT_VAR', cast=str) == '42'
+
+
+def test_schema_dict_cast():
+    env = Env(DICT_VAR=dict(key=str, value=str))
+
+    assert env('DICT_VAR') == {'foo': 'bar,test'}
+
+
+def test_schema_compile():
+    env = Env(INT_VAR=int)
+    env.scheme['FLOAT_VAR'] = (float, 0.0)
+    env.scheme['NOT_PRESENT_VAR'] = ([int], [1, 2])
+
+    assert env('INT_VAR') == 42
+    assert_type_and_value(float, 33.3, env('FLOAT_VAR'))
+    assert env('NOT_PRESENT_VAR') == [1, 2]
+
+    env.scheme['INT_VAR'] = str
+    env.scheme['FLOAT_VAR'] = (int, 0)
+    del env.scheme['NOT_PRESENT_VAR']
+
+    assert env('INT_VAR') == '42'
+    with pytest.raises(ValueError):
+        env('FLOAT_VAR')
+    with pytest.raises(ImproperlyConfigured):
+        env('NOT_PRESENT_VAR')
+
+    env.compile()
+    assert env('INT_VAR') == '42'
+
+
+def test_schema_changes_invalidate_value_cache():
+    env = Env(cache=True, INT_VAR=int)
+    assert env('INT_VAR') == 42
+
+    env.scheme['INT_VAR'] = str
+    assert env('INT_VAR') == '42'
+
+
+def test_resolve():
+    env = Env(
+        INT_VAR=int,
+        NOT_PRESENT_VAR=(float, 33.3),
+        INT_LIST=[int],
+    )
+
+    assert env.resolve() == {
+        'INT_VAR': 42,
+        'NOT_PRESENT_VAR': 33.3,
+        'INT_LIST': [42, 33],
+    }
+
+
+def test_resolve_many():
+    env = Env(INT_VAR=str)
+
+    values = env.resolve_many({
+        'INT_VAR': int,
+        'BOOL_TRUE_VAR': bool,
+        'DEFAULT_LIST': ([int], [2]),
+        'STR_VAR': None,
+    })
+
+    assert values == {
+        'INT_VAR': 42,
+        'BOOL_TRUE_VAR': True,
+        'DEFAULT_LIST': [2],
+        'STR_VAR': 'bar',
+    }
+
+
+def test_resolve_many_reports_all_errors():
+    env = Env()
+
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        env.resolve_many({
+            'NOT_PRESENT_VAR': int,
+            'STR_VAR': int,
+            'INT_VAR': int,
+            'NOT_PRESENT_VAR2': str,
+        })
+
+    assert str(excinfo.value) == (
+        'Unable to resolve 3 environment variable(s):\n'
+        '  Set the NOT_PRESENT_VAR environment variable\n'
+        '  Invalid value of the STR_VAR environment variable: '
+        "invalid literal for int() with base 10: 'bar'\n"
+        '  Set the NOT_PRESENT_VAR2 environment variable'
+    )
+
+
+def test_resolve_many_reports_any_cast_error():
+    env = Env()
+    env.ENVIRON = {'DICT_VAR': 'a;b', 'INT_VAR': 'x'}
+
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        env.resolve_many({
+            'NOT_PRESENT_VAR': int,
+            'DICT_VAR': {'value': int},
+            'INT_VAR': int,
+        })
+
+    assert str(excinfo.value) == (
+        'Unable to resolve 3 environment variable(s):\n'
+        '  Set the NOT_PRESENT_VAR environment variable\n'
+        '  Invalid value of the DICT_VAR environment variable: '
+        'list index out of range\n'
+        '  Invalid value of the INT_VAR environment variable: '
+        "invalid literal for int() with base 10: 'x'"
+    )
@@ -0,0 +1,79 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import urllib.parse
+
+import pytest
+
+from environ import Env
+from environ.environ import _urlparse, register_scheme
+
+
+@pytest.mark.parametrize('scheme', ['postgres', 'rediscache', 'smtps', 'solr'])
+def test_urllib_is_not_modified(scheme):
+    for name in dir(urllib.parse):
+        if name.startswith('uses_'):
+            assert scheme not in getattr(urllib.parse, name)
+
+
+@pytest.mark.parametrize(
+    'path',
+    ['/db', '/db;params', '/a;b/db;params', 'db;params', ';params', ''],
+)
+def test_urlparse_like_registered_scheme(path):
+    """Known schemes are parsed like the http scheme known by urllib."""
+    expected = urllib.parse.urlparse('http://user@host:5432' + path + '?a=1')
+    actual = _urlparse('postgres://user@host:5432' + path + '?a=1')
+
+    assert actual.scheme == 'postgres'
+    assert actual[1:] == expected[1:]
+
+
+def test_register_scheme(monkeypatch):
+    monkeypatch.setattr('environ.environ._URL_SCHEMES', set())
+    assert _urlparse('custom://host/db;params').path == '/db;params'
+
+    register_scheme('custom')
+
+    assert _urlparse('custom://host/db;params').path == '/db'
+    assert 'custom' not in urllib.parse.uses_params
+
+
+def test_url_uses_registered_schemes(monkeypatch):
+    monkeypatch.setattr(Env, 'ENVIRON', {'URL': 'redis://host/1;params'})
+
+    assert Env().url('URL').params == 'params'
+
+
+@pytest.mark.parametrize(
+    'url',
+    [
+        'filecache:///var/tmp/x',
+        'redis://',
+        'redis://?db=1#f',
+        'sqlite:///db.sqlite3;params',
+        'postgres://user@host:5432/db',
+    ],
+)
+def test_url_geturl_is_lossless(monkeypatch, url):
+    monkeypatch.setattr(Env, 'ENVIRON', {'URL': url})
+    result = Env().url('URL')
+
+    assert isinstance(result, Env.URL_CLASS)
+    assert result.geturl() == url
+    assert result._replace(path='/other').geturl().startswith(
+        url.split(':')[0] + '://')
+
+
+@pytest.mark.parametrize('path', ['/var/tmp/x', 'x', '', '//x'])
+def test_url_geturl_like_registered_scheme(path):
+    """Known schemes keep the "//" of URLs like the http scheme does."""
+    expected = urllib.parse.urlparse('http://' + path + '?a=1').geturl()
+    actual = _urlparse('filecache://' + path + '?a=1').geturl()
+
+    assert actual == 'filecache' + expected[len('http'):]
@@ -0,0 +1,139 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import os
+
+import pytest
+
+from environ import Env, environ as environ_module
+from environ.compat import ImproperlyConfigured
+
+
+@pytest.fixture(autouse=True)
+def secret_files(monkeypatch):
+    monkeypatch.setattr(environ_module, '_secret_files', {})
+
+
+@pytest.fixture
+def secrets(monkeypatch, tmp_path):
+    (tmp_path / 'db').write_text('postgres://user:s3cr$t@db:5432/app\n')
+    (tmp_path / 'password').write_text('hunter2\r\n')
+    (tmp_path / 'workers').write_text('4')
+    environ = {
+        'DATABASE_URL_FILE': str(tmp_path / 'db'),
+        'PASSWORD_FILE': str(tmp_path / 'password'),
+        'WORKERS_FILE': str(tmp_path / 'workers'),
+    }
+    monkeypatch.setattr(Env, 'ENVIRON', environ)
+    return environ
+
+
+def test_secret_files(secrets):
+    env = Env(secret_files=True)
+    assert env.str('PASSWORD') == 'hunter2'
+    assert env.int('WORKERS') == 4
+    assert env.db()['PASSWORD'] == 's3cr$t'
+    assert env.str('MISSING', default='x') == 'x'
+
+
+def test_secret_files_disabled(secrets):
+    env = Env()
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        env.str('PASSWORD')
+    assert str(excinfo.value) == 'Set the PASSWORD environment variable'
+    assert env.str('PASSWORD', default='x') == 'x'
+
+
+def test_secret_files_environ_takes_precedence(secrets):
+    secrets['PASSWORD'] = 'from-environ'
+    assert Env(secret_files=True).str('PASSWORD') == 'from-environ'
+
+
+def test_secret_files_scheme_and_cache(secrets, tmp_path):
+    env = Env(secret_files=True, cache=True, WORKERS=int)
+    assert env('WORKERS') == 4
+    assert env('WORKERS') == 4
+    assert env.cache_info().hits == 1
+
+    path = tmp_path / 'workers'
+    path.write_text('16')
+    stat = path.stat()
+    os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert env('WORKERS') == 16
+
+
+def test_secret_files_revalidated_on_rotation(secrets, tmp_path):
+    env = Env(secret_files=True)
+    assert env.str('PASSWORD') == 'hunter2'
+
+    rotated = tmp_path / 'password.new'
+    rotated.write_text('correct horse')
+    os.replace(str(rotated), str(tmp_path / 'password'))
+    assert env.str('PASSWORD') == 'correct horse'
+
+
+def test_secret_files_read_once(secrets, monkeypatch):
+    env = Env(secret_files=True)
+    assert env.str('PASSWORD') == 'hunter2'
+
+    def fail(*args, **kwargs):
+        raise AssertionError('secret file read again')
+
+    monkeypatch.setattr('builtins.open', fail)
+    assert env.str('PASSWORD') == 'hunter2'
+
+
+def test_secret_files_unreadable(secrets, tmp_path):
+    missing = str(tmp_path / 'missing')
+    secrets['PASSWORD_FILE'] = missing
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        Env(secret_files=True).str('PASSWORD')
+    assert str(excinfo.value).startswith(
+        'Unable to read PASSWORD from {}, set by the PASSWORD_FILE '
+        'environment variable: '.format(missing))
+
+
+def test_prefetch_secret_files(secrets, monkeypatch):
+    env = Env(secret_files=True, PASSWORD=str, WORKERS=int, DEBUG=bool)
+    assert sorted(env.prefetch_secret_files()) == ['PASSWORD', 'WORKERS']
+    assert len(environ_module._secret_files) == 2
+
+    monkeypatch.setattr('builtins.open', None)
+    assert env.str('PASSWORD') == 'hunter2'
+
+
+def test_prefetch_secret_files_names(secrets):
+    env = Env(secret_files=True)
+    assert env.prefetch_secret_files() == []
+    assert env.prefetch_secret_files(['DATABASE_URL', 'MISSING']) == [
+        'DATABASE_URL']
+    assert len(environ_module._secret_files) == 1
+
+
+def test_prefetch_secret_files_skips_unrelated(secrets, tmp_path):
+    secrets['PID_FILE'] = str(tmp_path / 'app.pid')
+    secrets['LOG_FILE'] = str(tmp_path / 'app.log')
+    secrets['PASSWORD'] = 'from-environ'
+    env = Env(secret_files=True, PASSWORD=str, WORKERS=int)
+
+    assert env.prefetch_secret_files() == ['WORKERS']
+    assert env.prefetch_secret_files(['PASSWORD']) == []
+    assert len(environ_module._secret_files) == 1
+
+
+def test_prefetch_secret_files_errors(secrets, tmp_path):
+    secrets['PASSWORD_FILE'] = str(tmp_path / 'missing')
+    secrets['TOKEN_FILE'] = str(tmp_path)
+    env = Env(secret_files=True, PASSWORD=str, TOKEN=str, WORKERS=int)
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        env.prefetch_secret_files(max_workers=2)
+
+    message = str(excinfo.value)
+    assert message.startswith('Unable to read 2 secret file(s):\n')
+    assert 'PASSWORD_FILE' in message
+    assert 'TOKEN_FILE' in message
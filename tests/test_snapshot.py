@@ -0,0 +1,69 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import copy
+import os
+import pickle
+
+import pytest
+
+from environ import Env, EnvironSnapshot
+from .fixtures import FakeEnv
+
+
+@pytest.fixture
+def snapshot():
+    os.environ = Env.ENVIRON = FakeEnv.generate_data()
+    return Env.snapshot()
+
+
+def test_snapshot_is_a_copy(snapshot):
+    assert isinstance(snapshot, EnvironSnapshot)
+    assert snapshot['STR_VAR'] == Env.ENVIRON['STR_VAR']
+
+    Env.ENVIRON['STR_VAR'] = 'baz'
+    assert snapshot['STR_VAR'] == 'bar'
+
+
+@pytest.mark.parametrize(
+    'mutate',
+    [
+        lambda s: s.__setitem__('STR_VAR', 'baz'),
+        lambda s: s.__delitem__('STR_VAR'),
+        lambda s: s.update(STR_VAR='baz'),
+        lambda s: s.setdefault('NEW_VAR', 'baz'),
+        lambda s: s.pop('STR_VAR'),
+        lambda s: s.popitem(),
+        lambda s: s.clear(),
+    ],
+)
+def test_snapshot_is_read_only(snapshot, mutate):
+    with pytest.raises(TypeError) as excinfo:
+        mutate(snapshot)
+    assert str(excinfo.value) == 'EnvironSnapshot is read-only'
+    assert snapshot['STR_VAR'] == 'bar'
+
+
+def test_snapshot_copy_and_pickle(snapshot):
+    assert copy.copy(snapshot) is snapshot
+    assert copy.deepcopy(snapshot) is snapshot
+
+    restored = pickle.loads(pickle.dumps(snapshot))
+    assert isinstance(restored, EnvironSnapshot)
+    assert restored == snapshot
+
+
+def test_env_bound_to_snapshot(snapshot, simple_env_file):
+    env = Env()
+    env.ENVIRON = snapshot
+
+    env.read_env(simple_env_file)
+
+    assert 'DB_NAME' in Env.ENVIRON
+    assert 'DB_NAME' not in env
+    assert env.int('INT_VAR') == 42
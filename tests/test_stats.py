@@ -0,0 +1,76 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import pytest
+
+from environ import AccessStats, Env
+
+
+@pytest.fixture
+def env(monkeypatch):
+    monkeypatch.setattr(Env, 'ENVIRON', {
+        'INT_VAR': '42',
+        'PROXIED_VAR': '$INT_VAR',
+    })
+    return Env(interpolate=True)
+
+
+def read_int(env):
+    return env.int('INT_VAR')
+
+
+def test_stats_disabled(env):
+    env.int('INT_VAR')
+
+    assert env.stats() == {}
+    assert 'get_value' not in vars(env)
+
+
+def test_stats(env):
+    env.enable_stats(max_call_sites=2)
+
+    for _ in range(3):
+        read_int(env)
+    env('INT_VAR', cast=int)
+    env.get_value('INT_VAR')
+    env.get_value('MISSING_VAR', default=None)
+
+    stats = env.stats()
+    assert set(stats) == {'INT_VAR', 'MISSING_VAR'}
+
+    int_stats = stats['INT_VAR']
+    assert isinstance(int_stats, AccessStats)
+    assert int_stats.accesses == 5
+    assert int_stats.cast_time > 0
+    assert [(site[0], site[2]) for site in int_stats.call_sites] == [
+        (__file__, 'read_int'),
+        (__file__, 'test_stats'),
+    ]
+    assert stats['MISSING_VAR'].accesses == 1
+
+
+def test_stats_proxied(env):
+    env.enable_stats()
+    assert env.int('PROXIED_VAR') == 42
+
+    stats = env.stats()
+    assert stats['PROXIED_VAR'].accesses == 1
+    assert stats['INT_VAR'].accesses == 1
+
+
+def test_stats_disable_and_clear(env):
+    env.enable_stats()
+    read_int(env)
+    env.disable_stats()
+    read_int(env)
+
+    assert 'get_value' not in vars(env)
+    assert env.stats()['INT_VAR'].accesses == 1
+
+    env.stats_clear()
+    assert env.stats() == {}
@@ -0,0 +1,111 @@
+# This file is part of the django-environ-2.
+#
+# Copyright (C) 2021 Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (C) 2013-2021 Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE file that was distributed with this source code.
+
+import os
+
+import pytest
+
+from environ import CacheInfo, Env
+from .fixtures import FakeEnv
+
+
+@pytest.fixture
+def env():
+    os.environ = Env.ENVIRON = FakeEnv.generate_data()
+    return Env(cache=True)
+
+
+def test_cache_disabled_by_default():
+    assert Env().cache_info() == CacheInfo(0, 0, 0)
+
+
+def test_cache_hits_and_misses(env):
+    assert env.int('INT_VAR') == 42
+    assert env.int('INT_VAR') == 42
+    assert env('INT_VAR') == '42'
+    assert env.int('NOT_PRESENT_VAR', default=1) == 1
+    assert env.int('NOT_PRESENT_VAR', default=1) == 1
+
+    assert env.cache_info() == CacheInfo(hits=2, misses=3, currsize=3)
+
+    env.cache_clear()
+    assert env.cache_info() == CacheInfo(0, 0, 0)
+
+
+def test_cache_invalidated_by_mutation(env):
+    assert env.int('INT_VAR') == 42
+
+    env.ENVIRON['INT_VAR'] = '43'
+    assert env.int('INT_VAR') == 43
+
+    del env.ENVIRON['INT_VAR']
+    assert env.int('INT_VAR', default=0) == 0
+
+    assert env.cache_info().hits == 0
+
+
+def test_cache_invalidated_by_read_env(env, simple_env_file):
+    assert env('DB_NAME', default=None) is None
+
+    env.read_env(simple_env_file, DB_USER='admin')
+
+    assert env('DB_NAME', default=None) == 'dev_db'
+    assert env('DB_USER', default=None) == 'admin'
+    assert env.cache_info().hits == 0
+
+
+def test_cache_default_types_are_distinguished(env):
+    assert env('NOT_PRESENT_VAR', default=1) == 1
+    assert env('NOT_PRESENT_VAR', default=True) is True
+
+
+def test_cache_returns_copies(env):
+    env.dict('DICT_VAR')['foo'] = 'baz'
+    env.list('INT_LIST', cast=int).append(1)
+
+    assert env.dict('DICT_VAR') == {'foo': 'bar', 'test': 'on'}
+    assert env.cache_info().hits == 1
+
+
+def test_cache_returns_deep_copies(env):
+    env.ENVIRON['JSON_VAR'] = '{"hosts": ["a", "b"], "limits": {"read": 1}}'
+    env.ENVIRON['DATABASE_URL'] = 'postgres://user@host/db?sslmode=require'
+
+    config = env.json('JSON_VAR')
+    config['hosts'].append('c')
+    config['limits']['read'] = 2
+    env.db()['OPTIONS']['sslmode'] = 'disable'
+
+    assert env.json('JSON_VAR') == {'hosts': ['a', 'b'], 'limits': {'read': 1}}
+    assert env.db()['OPTIONS'] == {'sslmode': 'require'}
+    assert env.cache_info().hits == 2
+
+
+def test_cache_unhashable_casts(env):
+    assert env('INT_LIST', cast=[int]) == [42, 33]
+    assert env('INT_LIST', cast=[int]) == [42, 33]
+    assert env('INT_LIST', cast=(int,)) == (42, 33)
+    assert env('DICT_VAR', cast={'value': str}) == {'foo': 'bar,test'}
+    assert env('DICT_VAR', cast={'value': str}) == {'foo': 'bar,test'}
+    assert env('NOT_PRESENT_VAR', default=[1]) == [1]
+    assert env('NOT_PRESENT_VAR', default=[1]) == [1]
+    assert env('NOT_PRESENT_VAR', default=[2]) == [2]
+
+    assert env.cache_info() == CacheInfo(hits=3, misses=5, currsize=5)
+
+    env.ENVIRON['INT_LIST'] = '1,2'
+    assert env('INT_LIST', cast=[int]) == [1, 2]
+
+
+def test_cache_skips_proxied_values():
+    os.environ = Env.ENVIRON = FakeEnv.generate_data()
+    env = Env(interpolate=True, cache=True)
+
+    assert env('PROXIED_VAR') == 'bar'
+    env.ENVIRON['STR_VAR'] = 'baz'
+    assert env('PROXIED_VAR') == 'baz'